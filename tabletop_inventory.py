@@ -13,28 +13,50 @@ Version: 1.2.0
 """
 
 import json
+import logging
 import os
+import re
 import sys
 import uuid
-from dataclasses import dataclass, asdict, field
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional
-from enum import Enum, auto
+from typing import Dict, List, Optional, Tuple
+from enum import IntEnum
+from math import fsum
+from operator import attrgetter, mul
+
+# orjson is an optional, much faster drop-in for character save/load
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Modern GUI with PyQt6
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QPushButton, QLabel, QLineEdit, QTableWidget, QTableWidgetItem, 
+    QPushButton, QLabel, QLineEdit, QTableView, 
     QComboBox, QSpinBox, QDoubleSpinBox, QTabWidget, QFileDialog,
     QMessageBox, QInputDialog, QGroupBox, QFormLayout,
-    QTextEdit, QHeaderView, QSplitter, QFrame, QToolBar, QStyle, QStyleFactory, QMenu, QGridLayout, QSplashScreen
+    QTextEdit, QHeaderView, QSplitter, QFrame, QToolBar, QStyle, QStyleFactory, QMenu, QGridLayout, QSplashScreen,
+    QStyledItemDelegate
 )
 from PyQt6.QtGui import (
-    QFont, QAction, QColor, QPalette, QPixmap,
-    QShortcut, QKeySequence
-    # QPainter removed as no longer needed after removing Treasure.png background
+    QFont, QAction, QColor, QIcon, QPalette, QPixmap, QPixmapCache,
+    QShortcut, QKeySequence, QPainter
+)
+from PyQt6.QtCore import (
+    Qt, QSize, QTimer, QEvent, QRect, pyqtSignal, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
 )
-from PyQt6.QtCore import Qt, QSize, QTimer
+
+# Directory containing this module, used to resolve relative asset paths
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# How the last-saved time is shown in the status bar
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 # Global stylesheet for the application
 GLOBAL_STYLESHEET = """
@@ -100,7 +122,7 @@ QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QDoubleSpinBox:focus, QComboBo
     border: 1px solid #6A9DDF;
 }
 
-QTableWidget {
+QTableView {
     gridline-color: #3A3A3A;
     background-color: #222222;
     selection-background-color: #3A6EA5;
@@ -142,24 +164,40 @@ QGroupBox {
     background-color: #2A2A2A;
     border: 1px solid #555555;
     border-radius: 5px;
-    margin-top: 15px;
+    margin-top: 10px;
+    padding-top: 10px;
     font-weight: bold;
 }
 
 QGroupBox::title {
     subcontrol-origin: margin;
     subcontrol-position: top center;
-    padding: 0 10px;
+    left: 10px;
+    padding: 0 5px;
     color: #E0E0E0;
 }
 
+QMenuBar {
+    background-color: #2d2d2d;
+}
+
+QMenuBar::item:selected {
+    background-color: #3d3d3d;
+}
+
 QStatusBar {
     background-color: #1A1A1A;
     color: #E0E0E0;
+    border-top: 1px solid #555555;
 }
 
 QStatusBar QLabel {
-    padding: 0 8px;
+    padding: 2px 10px;
+    border-right: 1px solid #555555;
+}
+
+QStatusBar QLabel[last="true"] {
+    border-right: none;
 }
 
 QScrollBar:vertical {
@@ -259,19 +297,209 @@ QProgressBar::chunk {
     width: 10px;
     margin: 0.5px;
 }
+
+/* Character tab */
+QFrame#charSelectFrame {
+    background-color: rgba(60, 60, 60, 120);
+    border-radius: 5px;
+}
+
+QLabel#charSelectLabel {
+    font-weight: bold;
+    color: #cccccc;
+}
+
+QLineEdit[formField="true"] {
+    border-radius: 3px;
+}
+
+QLabel#portraitTitle {
+    font-weight: bold;
+    font-size: 10pt;
+    color: #e0e0e0;
+}
+
+QLabel#portraitLabel {
+    background-color: #333333;
+    border: 1px solid #6A9DDF;
+    border-radius: 4px;
+}
+
+QPushButton#changePortraitButton {
+    padding: 5px 10px;
+}
+
+QSpinBox#platinumSpin, QSpinBox#platinumSpin QLineEdit {
+    background: rgba(220, 220, 255, 30);
+}
+
+QSpinBox#goldSpin, QSpinBox#goldSpin QLineEdit {
+    background: rgba(255, 255, 0, 30);
+}
+
+QSpinBox#silverSpin, QSpinBox#silverSpin QLineEdit {
+    background: rgba(200, 200, 200, 30);
+}
+
+QSpinBox#copperSpin, QSpinBox#copperSpin QLineEdit {
+    background: rgba(180, 100, 0, 30);
+}
+
+QFrame#totalCurrencyPanel {
+    background-color: rgba(30, 30, 30, 180);
+    border-radius: 5px;
+}
+
+QFrame#totalCurrencyFrame {
+    border: none;
+    border-radius: 5px;
+}
+
+QLabel#totalCurrencyLabel {
+    font-weight: bold;
+    font-size: 18pt;
+    color: #FFD700;
+    background: rgba(30, 30, 30, 150);
+    border-radius: 8px;
+    padding: 8px 18px;
+    margin-right: 100px;
+}
+
+/* Inventory tab */
+QPushButton#addItemButton {
+    padding: 5px;
+    font-weight: bold;
+}
+
+QTableView#inventoryTable {
+    gridline-color: #444444;
+    alternate-background-color: #383838;
+}
+
+QFrame#inventorySummary {
+    background-color: rgba(60, 60, 60, 120);
+    border-radius: 5px;
+    padding: 5px;
+}
+
+QFrame#inventorySummary QLabel {
+    font-weight: bold;
+}
+
+/* Notes tab */
+QTextEdit#notesEdit {
+    padding: 8px;
+    border-radius: 3px;
+}
+
+QToolBar#notesToolbar {
+    spacing: 2px;
+    background-color: #333333;
+    border-radius: 3px;
+}
+
+QMenu#templatesMenu {
+    background-color: #333333;
+    border: 1px solid #555555;
+}
+
+QLabel#notesPreviewTitle {
+    font-weight: bold;
+    background-color: #333333;
+    padding: 5px;
+}
+
+QTextEdit#notesPreview {
+    background-color: #2a2a2a;
+    padding: 10px;
+    border-radius: 3px;
+}
 """
 
-class ItemRarity(Enum):
-    """Enum representing item rarity levels"""
-    COMMON = auto()
-    UNCOMMON = auto()
-    RARE = auto()
-    VERY_RARE = auto()
-    LEGENDARY = auto()
-    ARTIFACT = auto()
+# Whitespace-collapsed copy of the stylesheet, built once at import
+_GLOBAL_QSS = re.sub(r"\s+", " ", GLOBAL_STYLESHEET).strip()
+
+
+def dump_json(data) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def load_json(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-@dataclass
+# Dataclass __slots__ support needs Python 3.10+; older versions keep __dict__
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Standard style icons, created on first use and shared by every widget
+_ICONS: Dict[QStyle.StandardPixmap, QIcon] = {}
+
+
+def standard_icon(pixmap: QStyle.StandardPixmap) -> QIcon:
+    """Return the application style's icon for a standard pixmap, cached"""
+    icon = _ICONS.get(pixmap)
+    if icon is None:
+        icon = _ICONS[pixmap] = QApplication.style().standardIcon(pixmap)
+    return icon
+
+
+# Markdown subset supported by the notes preview, as (pattern, replacement)
+# pairs applied in order; bold must run before italic
+_MARKDOWN_RULES = (
+    (re.compile(r"^### (.*?)(?: #+)?$", re.M), r"<h3>\1</h3>"),
+    (re.compile(r"^## (.*?)(?: #+)?$", re.M), r"<h2>\1</h2>"),
+    (re.compile(r"^# (.*?)(?: #+)?$", re.M), r"<h1>\1</h1>"),
+    (re.compile(r"\*\*(.+?)\*\*", re.S), r"<b>\1</b>"),
+    (re.compile(r"\*(.+?)\*", re.S), r"<i>\1</i>"),
+    (re.compile(r"__(.+?)__", re.S), r"<u>\1</u>"),
+    (re.compile(r"~~(.+?)~~", re.S), r"<s>\1</s>"),
+    (re.compile(r"`(.+?)`", re.S), r"<code>\1</code>"),
+    (re.compile(r"^- ", re.M), "• "),
+    (re.compile(r"^---$", re.M), "<hr>"),
+    (re.compile(r"^> (.*)$", re.M), r"<blockquote>\1</blockquote>"),
+)
+
+
+@lru_cache(maxsize=64)
+def render_notes_html(text: str) -> str:
+    """Convert notes Markdown to the HTML shown in the preview, cached"""
+    for pattern, replacement in _MARKDOWN_RULES:
+        text = pattern.sub(replacement, text)
+    return f"<div style='color: #e0e0e0; font-family: Segoe UI, Arial; font-size: 10pt;'>{text}</div>"
+
+
+class ItemRarity(IntEnum):
+    """Enum representing item rarity levels
+    
+    Values run from 0 so a rarity can index per-rarity tuples directly.
+    Saves store the name, not the value.
+    """
+    COMMON = 0
+    UNCOMMON = 1
+    RARE = 2
+    VERY_RARE = 3
+    LEGENDARY = 4
+    ARTIFACT = 5
+
+
+# Attach each rarity's display name as a plain attribute so reading it is
+# a single lookup on the (singleton) member
+for _rarity in ItemRarity:
+    _rarity.display = _rarity.name.capitalize()
+del _rarity
+
+# Reverse lookup from display name, used by the UI combos
+_RARITY_FROM_DISPLAY = {rarity.display: rarity for rarity in ItemRarity}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Item:
     """Represents an inventory item"""
     id: str  # UUID for the item
@@ -283,14 +511,44 @@ class Item:
     rarity: ItemRarity = ItemRarity.COMMON
     equipped: bool = False
     tags: List[str] = field(default_factory=list)
+    # Lowercased name and description for searching, built on first use
+    _search_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Quantity, weight and value as shown in the inventory table, built on first use
+    _number_text: Optional[Tuple[str, str, str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Ensure id is a string UUID"""
         if not self.id:
             self.id = str(uuid.uuid4())
+    
+    def search_text(self) -> str:
+        """Lowercased name and description, one per line, for case-insensitive search"""
+        if self._search_text is None:
+            self._search_text = f"{self.name}\n{self.description}".lower()
+        return self._search_text
+    
+    def number_text(self) -> Tuple[str, str, str]:
+        """Quantity, weight and value formatted for display"""
+        if self._number_text is None:
+            self._number_text = (str(self.quantity), f"{self.weight:.1f}", f"{self.value:.1f}")
+        return self._number_text
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the item"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "quantity": self.quantity,
+            "weight": self.weight,
+            "value": self.value,
+            "rarity": self.rarity.name,
+            "equipped": self.equipped,
+            "tags": list(self.tags),
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Currency:
     """Represents character currency with multiple denominations"""
     platinum: int = 0
@@ -298,12 +556,38 @@ class Currency:
     silver: int = 0
     copper: int = 0
     
+    # Copper value of one platinum, gold, silver and copper piece
+    COPPER_RATES = (1000, 100, 10, 1)
+    # Copper value of one piece, by denomination name
+    COPPER_VALUES = {"platinum": 1000, "gold": 100, "silver": 10, "copper": 1}
+    
     def total_in_copper(self) -> int:
         """Convert all currency to copper value"""
         return self.copper + (self.silver * 10) + (self.gold * 100) + (self.platinum * 1000)
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the currency"""
+        return {
+            "platinum": self.platinum,
+            "gold": self.gold,
+            "silver": self.silver,
+            "copper": self.copper,
+        }
 
 
-@dataclass
+# Attribute getters used to read inventory columns in bulk
+_QUANTITY = attrgetter("quantity")
+_WEIGHT = attrgetter("weight")
+_VALUE = attrgetter("value")
+
+
+# Fields read from a save file; any other keys in it are ignored
+_CHARACTER_FIELDS = ("id", "name", "game_system", "level", "notes", "portrait", "created_at", "updated_at")
+_ITEM_FIELDS = ("id", "name", "description", "quantity", "weight", "value", "rarity", "equipped", "tags")
+_CURRENCY_FIELDS = ("platinum", "gold", "silver", "copper")
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Character:
     """Represents a character and their inventory"""
     id: str  # UUID for the character
@@ -316,41 +600,133 @@ class Character:
     portrait: str = ""  # Path to character portrait image
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Internal state, declared so it gets a slot; not part of the saved data
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)  # Unsaved changes; cleared after load/save
+    _positions: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _total_weight: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _total_value: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _total_quantity: Optional[int] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Ensure id is a string UUID"""
         if not self.id:
             self.id = str(uuid.uuid4())
+        # Position of each item in the inventory list, by item id. Saves can
+        # repeat an id; like a scan, the index points at the first such item.
+        for index, item in enumerate(self.inventory):
+            self._positions.setdefault(item.id, index)
+        # Totals are cached on first use, then kept current by add_item/remove_item
+    
+    @property
+    def dirty(self) -> bool:
+        """Whether the character has changes that have not been saved"""
+        return self._dirty
+    
+    def mark_dirty(self) -> None:
+        """Flag the character as having unsaved changes"""
+        self._dirty = True
+    
+    def get_item(self, item_id: str) -> Optional[Item]:
+        """Look up an inventory item by ID"""
+        index = self._positions.get(item_id)
+        return None if index is None else self.inventory[index]
     
     def add_item(self, item: Item) -> None:
         """Add an item to the inventory"""
+        self._positions.setdefault(item.id, len(self.inventory))
         self.inventory.append(item)
-        self.updated_at = datetime.now().isoformat()
+        if self._total_weight is not None:
+            self._total_weight += item.quantity * item.weight
+            self._total_value += item.quantity * item.value
+            self._total_quantity += item.quantity
+        self._dirty = True
     
     def remove_item(self, item_id: str) -> Optional[Item]:
         """Remove an item from inventory by ID"""
-        for i, item in enumerate(self.inventory):
-            if item.id == item_id:
-                self.updated_at = datetime.now().isoformat()
-                return self.inventory.pop(i)
-        return None
+        index = self._positions.pop(item_id, None)
+        if index is None:
+            return None
+        # Pop by position to keep the inventory in order; only the items
+        # after the gap move, so only they are renumbered. An entry that
+        # still points past an item (or is missing, for a later copy of the
+        # removed id) moves to that item, which is now the first with its id.
+        inventory = self.inventory
+        positions = self._positions
+        item = inventory.pop(index)
+        end = len(inventory)
+        for position in range(index, end):
+            item_id = inventory[position].id
+            if positions.get(item_id, end) > position:
+                positions[item_id] = position
+        if self.inventory:
+            if self._total_weight is not None:
+                self._total_weight -= item.quantity * item.weight
+                self._total_value -= item.quantity * item.value
+                self._total_quantity -= item.quantity
+        else:
+            # Don't carry float rounding residue into an empty inventory
+            self._total_weight = self._total_value = 0.0
+            self._total_quantity = 0
+        self._dirty = True
+        return item
+    
+    def _recalculate_totals(self) -> None:
+        """Recompute the cached quantity, weight and value totals from the inventory"""
+        inventory = self.inventory
+        # Column-wise map/mul keeps the per-item loop inside C; fsum avoids
+        # accumulating rounding error across many fractional weights
+        self._total_weight = fsum(map(mul, map(_QUANTITY, inventory), map(_WEIGHT, inventory)))
+        self._total_value = fsum(map(mul, map(_QUANTITY, inventory), map(_VALUE, inventory)))
+        self._total_quantity = sum(map(_QUANTITY, inventory))
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the character"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "game_system": self.game_system,
+            "level": self.level,
+            "inventory": [item.to_dict() for item in self.inventory],
+            "currency": self.currency.to_dict(),
+            "notes": self.notes,
+            "portrait": self.portrait,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+    
+    def total_quantity(self) -> int:
+        """Total number of items, counting each stack's quantity"""
+        if self._total_quantity is None:
+            self._recalculate_totals()
+        return self._total_quantity
     
     def total_weight(self) -> float:
-        """Calculate total weight of all inventory items"""
-        return sum(item.quantity * item.weight for item in self.inventory)
+        """Total weight of all inventory items"""
+        if self._total_weight is None:
+            self._recalculate_totals()
+        return self._total_weight
     
     def total_value(self) -> float:
-        """Calculate total value of all inventory items"""
-        return sum(item.quantity * item.value for item in self.inventory)
+        """Total value of all inventory items"""
+        if self._total_value is None:
+            self._recalculate_totals()
+        return self._total_value
 
 
 class CharacterManager:
     """Manages character data and persistence"""
     
+    # {character id: {"name", "file", "mtime"}} of saved characters; kept out of
+    # the *.json pattern so it is never mistaken for a character file
+    INDEX_FILENAME = ".index"
+    
     def __init__(self, save_dir: str = None):
         """Initialize the character manager"""
         self.characters: Dict[str, Character] = {}
         self.save_dir = save_dir or os.path.join(os.path.expanduser("~"), "tabletop_inventory")
+        self.index_path = os.path.join(self.save_dir, self.INDEX_FILENAME)
+        self._index: Dict[str, dict] = {}
+        self._paths: Dict[str, str] = {}  # Save file path per character id
         
         # Create save directory if it doesn't exist
         os.makedirs(self.save_dir, exist_ok=True)
@@ -363,114 +739,450 @@ class CharacterManager:
     
     def delete_character(self, character_id: str) -> bool:
         """Delete a character by ID"""
-        if character_id in self.characters:
-            del self.characters[character_id]
-            
-            # Remove saved file if it exists
-            save_path = os.path.join(self.save_dir, f"{character_id}.json")
+        known = self.characters.pop(character_id, None) is not None
+        
+        # Resolve the file before the index entry that names it is dropped
+        save_path = self._save_path(character_id)
+        del self._paths[character_id]
+        if self._index.pop(character_id, None) is not None:
+            self._write_index()
+            known = True
+        
+        # Remove saved file if it exists; trying is one syscall, where
+        # checking first would be two
+        try:
+            os.remove(save_path)
+            known = True
+        except FileNotFoundError:
+            pass
+        
+        return known
+    
+    def get_character(self, character_id: str) -> Optional[Character]:
+        """Get a character by ID, loading its save file on first use"""
+        character = self.characters.get(character_id)
+        if character is None:
+            save_path = self._save_path(character_id)
             if os.path.exists(save_path):
-                os.remove(save_path)
-            
-            return True
-        return False
+                character = self.load_character(save_path)
+        return character
     
     def save_character(self, character_id: str) -> bool:
         """Save a character to file"""
         if character_id not in self.characters:
             return False
         
-        character = self.characters[character_id]
-        save_path = os.path.join(self.save_dir, f"{character_id}.json")
+        job = self.prepare_save(character_id)
+        if job is None:
+            return True
+        
+        saved = self.write_save(*job)
+        self.finish_save(character_id, job, saved)
+        return saved
+    
+    def prepare_save(self, character_id: str) -> Optional[Tuple[str, dict]]:
+        """Snapshot a character for writing as (save path, data)
+        
+        Returns None if the character is unknown or the file on disk is
+        already up to date. The character is marked clean here, so edits
+        made while the snapshot is being written flag it dirty again.
+        """
+        character = self.characters.get(character_id)
+        if character is None:
+            return None
         
+        save_path = self._save_path(character_id)
+        
+        # Nothing to write if the file on disk is already up to date
+        if not character.dirty and os.path.exists(save_path):
+            return None
+        
+        # Timestamp once per save rather than on every edit
+        character.updated_at = datetime.now().isoformat()
+        character._dirty = False
+        return save_path, character.to_dict()
+    
+    def write_save(self, save_path: str, data: dict) -> bool:
+        """Write a prepared snapshot; safe to call from a worker thread"""
         try:
-            # Convert character to dictionary
-            character_dict = asdict(character)
-            
-            # Convert enum values to strings
-            for item in character_dict["inventory"]:
-                if isinstance(item["rarity"], ItemRarity):
-                    item["rarity"] = item["rarity"].name
-            
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(character_dict, f, indent=2)
+            self._write_file(save_path, dump_json(data))
             return True
         
         except Exception as e:
             print(f"Error saving character: {e}")
             return False
     
+    def finish_save(self, character_id: str, job: Tuple[str, dict], saved: bool) -> None:
+        """Record the outcome of writing a prepared snapshot"""
+        character = self.characters.get(character_id)
+        if character is None:
+            # Deleted while the save was pending; don't index it again
+            return
+        if not saved:
+            character.mark_dirty()
+            return
+        
+        save_path, data = job
+        try:
+            mtime = os.stat(save_path).st_mtime_ns
+        except OSError:
+            mtime = None  # Matches no file, so it is read again next time
+        entry = {"name": data["name"], "file": os.path.basename(save_path), "mtime": mtime}
+        if self._index.get(character_id) != entry:
+            self._index[character_id] = entry
+            self._write_index()
+    
+    def _save_path(self, character_id: str) -> str:
+        """Path of a character's save file, preferring the index's record"""
+        path = self._paths.get(character_id)
+        if path is None:
+            entry = self._index.get(character_id)
+            filename = entry["file"] if entry else f"{character_id}.json"
+            path = self._paths[character_id] = os.path.join(self.save_dir, filename)
+        return path
+    
+    def _write_file(self, path: str, data: bytes) -> None:
+        """Write a file atomically so a crash mid-write never truncates it"""
+        tmp_path = path + ".tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    def _write_index(self) -> None:
+        """Save the character index next to the character files"""
+        try:
+            self._write_file(self.index_path, dump_json(self._index))
+        except Exception as e:
+            print(f"Error saving character index: {e}")
+    
+    def _saved_character_mtimes(self) -> Dict[str, int]:
+        """Modification time of each character save file, by file name"""
+        with os.scandir(self.save_dir) as entries:
+            return {entry.name: entry.stat().st_mtime_ns for entry in entries
+                    if entry.name.endswith(".json")}
+    
+    def list_characters(self) -> List[Tuple[str, str]]:
+        """List (id, name) of saved characters without fully loading them"""
+        try:
+            with open(self.index_path, 'rb') as f:
+                index = load_json(f.read())
+        except (OSError, ValueError):
+            index = {}
+        if not isinstance(index, dict):
+            index = {}
+        
+        # Reconcile the index with the files actually on disk, keeping only
+        # well-formed entries whose file is unchanged since it was indexed;
+        # anything else is picked up again by reading the file
+        mtimes = self._saved_character_mtimes()
+        current = {character_id: entry for character_id, entry in index.items()
+                   if self._valid_index_entry(entry)
+                   and mtimes.get(entry["file"]) == entry.get("mtime")}
+        indexed = {entry["file"] for entry in current.values()}
+        stale = [filename for filename in mtimes if filename not in indexed]
+        
+        if stale:
+            # Fully load files that are new or were changed outside this app
+            paths = [os.path.join(self.save_dir, filename) for filename in stale]
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                for path, character in zip(paths, executor.map(self._read_character, paths)):
+                    if character:
+                        filename = os.path.basename(path)
+                        self.characters[character.id] = character
+                        self._paths[character.id] = path
+                        current[character.id] = {"name": character.name, "file": filename, "mtime": mtimes[filename]}
+        
+        self._index = current
+        if current != index:
+            self._write_index()
+        
+        return [(character_id, entry["name"]) for character_id, entry in current.items()]
+    
+    def _valid_index_entry(self, entry) -> bool:
+        """Whether an entry read from the index file has the expected shape"""
+        return (isinstance(entry, dict)
+                and isinstance(entry.get("name"), str)
+                and isinstance(entry.get("file"), str))
+    
     def load_character(self, file_path: str) -> Optional[Character]:
         """Load a character from file"""
+        character = self._read_character(file_path)
+        if character:
+            # Add character to dictionary
+            self.characters[character.id] = character
+        return character
+    
+    def _read_character(self, file_path: str) -> Optional[Character]:
+        """Read a character from file without registering it"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                character_dict = json.load(f)
-            
-            # Convert string rarity back to enum
-            for item in character_dict["inventory"]:
-                if isinstance(item["rarity"], str):
-                    item["rarity"] = ItemRarity[item["rarity"]]
-              # Create character object
-            character = Character(
-                id=character_dict["id"],
-                name=character_dict["name"],
-                game_system=character_dict["game_system"],
-                level=character_dict["level"],
-                notes=character_dict["notes"],
-                portrait=character_dict.get("portrait", ""),  # Handle portrait path if present
-                created_at=character_dict["created_at"],
-                updated_at=character_dict["updated_at"]
-            )
+            with open(file_path, 'rb') as f:
+                character_dict = load_json(f.read())
             
-            # Add inventory items
+            # Build inventory items from their known keys, once the rarity
+            # string is converted back to the enum; unknown keys (e.g. from
+            # a newer version) are skipped rather than failing the load
+            inventory = []
             for item_dict in character_dict["inventory"]:
-                item = Item(
-                    id=item_dict["id"],
-                    name=item_dict["name"],
-                    description=item_dict["description"],
-                    quantity=item_dict["quantity"],
-                    weight=item_dict["weight"],
-                    value=item_dict["value"],
-                    rarity=item_dict["rarity"],
-                    equipped=item_dict["equipped"],
-                    tags=item_dict["tags"]
-                )
-                character.inventory.append(item)
+                if isinstance(item_dict["rarity"], str):
+                    item_dict["rarity"] = ItemRarity[item_dict["rarity"]]
+                inventory.append(Item(**{name: item_dict[name] for name in _ITEM_FIELDS if name in item_dict}))
             
-            # Add currency
             currency_dict = character_dict["currency"]
-            character.currency = Currency(
-                platinum=currency_dict["platinum"],
-                gold=currency_dict["gold"],
-                silver=currency_dict["silver"],
-                copper=currency_dict["copper"]
+            
+            # Create character object with its inventory so it gets indexed.
+            # Missing optional fields (e.g. portrait in older saves) keep
+            # their defaults.
+            character = Character(
+                **{name: character_dict[name] for name in _CHARACTER_FIELDS if name in character_dict},
+                inventory=inventory,
+                currency=Currency(**{name: currency_dict[name] for name in _CURRENCY_FIELDS if name in currency_dict})
             )
             
-            # Add character to dictionary
-            self.characters[character.id] = character
+            # Freshly loaded data matches the file
+            character._dirty = False
             
             return character
         
         except Exception as e:
             print(f"Error loading character: {e}")
             return None
+
+
+class SaveSignals(QObject):
+    """Signals emitted by SaveTask; QRunnable itself cannot carry signals"""
     
-    def load_all_characters(self) -> List[Character]:
-        """Load all characters from save directory"""
-        characters = []
+    finished = pyqtSignal(object, bool)  # (task, saved)
+
+
+class SaveTask(QRunnable):
+    """Writes a prepared character snapshot off the GUI thread"""
+    
+    def __init__(self, manager: CharacterManager, character_id: str, job: Tuple[str, dict]):
+        """Initialize the task with the snapshot from prepare_save"""
+        super().__init__()
+        self.manager = manager
+        self.character_id = character_id
+        self.job = job
+        self.signals = SaveSignals()
+        # Python owns the task (see MainWindow._save_tasks), not the pool
+        self.setAutoDelete(False)
+    
+    def run(self):
+        """Encode and write the snapshot, then report back"""
+        saved = self.manager.write_save(*self.job)
+        self.signals.finished.emit(self, saved)
+
+
+class InventoryModel(QAbstractTableModel):
+    """Table model exposing a list of items to the inventory view"""
+    
+    HEADERS = ["Name", "Quantity", "Weight", "Value", "Rarity", "Description", "Actions"]
+    ACTIONS_COLUMN = 6
+    
+    # Rarity colors for better visual distinction, indexed by ItemRarity
+    RARITY_COLORS = (
+        QColor("#aaaaaa"),  # Common
+        QColor("#1eff00"),  # Uncommon
+        QColor("#0070dd"),  # Rare
+        QColor("#a335ee"),  # Very rare
+        QColor("#ff8000"),  # Legendary
+        QColor("#e6cc80"),  # Artifact
+    )
+    
+    # Background colors (more subtle); common rows keep the table's own
+    # alternating background, which saves blending a near-invisible tint
+    RARITY_BG_COLORS = (
+        None,
+        QColor(30, 255, 0, 20),
+        QColor(0, 112, 221, 20),
+        QColor(163, 53, 238, 20),
+        QColor(255, 128, 0, 20),
+        QColor(230, 204, 128, 20),
+    )
+    
+    # Common items get slightly brighter text for better contrast
+    COMMON_TEXT_COLOR = QColor("#cccccc")
+    
+    # Roles data() answers; views ask for many more on every paint
+    HANDLED_ROLES = frozenset((
+        Qt.ItemDataRole.DisplayRole,
+        Qt.ItemDataRole.UserRole,
+        Qt.ItemDataRole.ForegroundRole,
+        Qt.ItemDataRole.BackgroundRole,
+        Qt.ItemDataRole.ToolTipRole,
+    ))
+    
+    def __init__(self, parent=None):
+        """Initialize an empty model"""
+        super().__init__(parent)
+        self._items: List[Item] = []
+    
+    def set_items(self, items: List[Item]) -> None:
+        """Replace the displayed items"""
+        self.beginResetModel()
+        self._items = list(items)
+        self.endResetModel()
+    
+    def append_item(self, item: Item) -> None:
+        """Add a row for an item at the end of the table"""
+        row = len(self._items)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._items.append(item)
+        self.endInsertRows()
+    
+    def remove_item(self, item_id: str) -> None:
+        """Remove the row showing the item with the given ID"""
+        for row, item in enumerate(self._items):
+            if item.id == item_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._items[row]
+                self.endRemoveRows()
+                return
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Number of items shown"""
+        return 0 if parent.isValid() else len(self._items)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Number of table columns"""
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Column titles"""
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        """Cells are read-only; the actions column is not selectable"""
+        if index.column() == self.ACTIONS_COLUMN:
+            return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Cell contents, colors and the item id (UserRole) for each row"""
+        if role not in self.HANDLED_ROLES:
+            return None
         
-        for file_name in os.listdir(self.save_dir):
-            if file_name.endswith(".json"):
-                file_path = os.path.join(self.save_dir, file_name)
-                character = self.load_character(file_path)
-                if character:
-                    characters.append(character)
+        item = self._items[index.row()]
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return item.name
+            elif column <= 3:
+                # Formatted once per item; views repaint cells on every hover
+                return item.number_text()[column - 1]
+            elif column == 4:
+                return item.rarity.display
+            elif column == 5:
+                return item.description
+            return None
+        
+        if role == Qt.ItemDataRole.UserRole:
+            return item.id
+        
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if item.rarity == ItemRarity.COMMON:
+                return self.COMMON_TEXT_COLOR
+            if column in (0, 4):
+                return self.RARITY_COLORS[item.rarity]
+            return None
+        
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.RARITY_BG_COLORS[item.rarity]
         
-        return characters
+        if role == Qt.ItemDataRole.ToolTipRole and column == self.ACTIONS_COLUMN:
+            return "Remove this item"
+        
+        return None
+
+
+class DeleteButtonDelegate(QStyledItemDelegate):
+    """Paints a delete button in each cell of a column and reports clicks
+    
+    The item id is read from the cell's UserRole data, so no widget or
+    signal connection is created per row.
+    """
+    
+    delete_requested = pyqtSignal(str)
+    
+    ICON_SIZE = 16
+    
+    # Button (border, fill) colors, normal and hovered
+    BUTTON_COLORS = (QColor("#555555"), QColor("#3A3A3A"))
+    HOVER_BUTTON_COLORS = (QColor("#ff5555"), QColor("#cc4444"))
+    
+    def __init__(self, icon, parent=None):
+        """Initialize the delegate with the icon drawn on each button"""
+        super().__init__(parent)
+        # Rasterized once; every cell paint reuses the same pixmap
+        self.icon_pixmap = icon.pixmap(self.ICON_SIZE, self.ICON_SIZE)
+    
+    def paint(self, painter, option, index):
+        """Draw a rounded button with the icon centered in the cell"""
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        border, fill = self.HOVER_BUTTON_COLORS if hovered else self.BUTTON_COLORS
+        button_rect = option.rect.adjusted(4, 2, -4, -2)
+        icon_rect = QRect(0, 0, self.ICON_SIZE, self.ICON_SIZE)
+        icon_rect.moveCenter(button_rect.center())
+        
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(border)
+        painter.setBrush(fill)
+        painter.drawRoundedRect(button_rect, 4, 4)
+        painter.drawPixmap(icon_rect, self.icon_pixmap)
+        painter.restore()
+    
+    def sizeHint(self, option, index):
+        """Size the column to fit the button"""
+        return QSize(36, 26)
+    
+    def editorEvent(self, event, model, option, index):
+        """Emit delete_requested when the button is clicked"""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and option.rect.contains(event.position().toPoint())):
+            item_id = index.data(Qt.ItemDataRole.UserRole)
+            if item_id:
+                self.delete_requested.emit(item_id)
+            return True
+        return super().editorEvent(event, model, option, index)
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
     
+    # Permanent status bar labels: (attribute name, initial text)
+    STATUS_LABELS = (
+        ("last_saved_label", "No character loaded"),
+        ("item_count_label", "Items: 0"),
+        ("total_weight_status_label", "Weight: 0.0 lb"),
+    )
+    
+    # Number of recent filter results kept for reuse
+    FILTER_CACHE_SIZE = 16
+    
+    # Sort order choices: (sort key, descending)
+    SORT_KEYS = {
+        "Name": (attrgetter("name"), False),
+        "Quantity": (_QUANTITY, True),
+        "Weight": (_WEIGHT, True),
+        "Value": (_VALUE, True),
+        "Rarity": (attrgetter("rarity"), True),
+    }
+    
+    # Rows measured when sizing inventory columns to their contents
+    RESIZE_SAMPLE_ROWS = 200
+    
     def __init__(self):
         """Initialize the main window"""
         super().__init__()
@@ -478,8 +1190,36 @@ class MainWindow(QMainWindow):
         self.character_manager = CharacterManager()
         self.current_character = None
         
+        # Recent filter results keyed by (search text, rarity, sort order);
+        # cleared whenever the displayed inventory changes
+        self._filter_cache = OrderedDict()
+        self._last_filter_key = None
+        # The inventory sorted by each sort order used so far, so changing
+        # the search text filters a ready-sorted list; cleared with the above
+        self._sorted_inventory: Dict[str, List[Item]] = {}
+        
+        # Notes text the preview was last rendered from
+        self._notes_preview_text = None
+        
+        # (updated_at, status bar text) for the last saved time shown
+        self._last_saved_text = (None, None)
+        
+        # Saves run one at a time, in order, off the GUI thread
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        self._save_tasks = set()  # Keeps queued tasks and their signals alive
+        
+        # Coalesces full UI refreshes requested within one event loop pass
+        self.ui_update_timer = QTimer(self)
+        self.ui_update_timer.setSingleShot(True)
+        self.ui_update_timer.setInterval(0)
+        self.ui_update_timer.timeout.connect(self.update_ui)
+        
         self.init_ui()
-        self.load_characters()
+        
+        # Scan for saved characters once the event loop is running, so the
+        # window can appear first
+        QTimer.singleShot(0, self.load_characters)
     
     def create_dark_palette(self):
         """Create a dark color palette for the application"""
@@ -510,19 +1250,19 @@ class MainWindow(QMainWindow):
         toolbar.setMovable(False)
         
         # Add character action
-        new_char_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon), "New Character", self)
+        new_char_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileIcon), "New Character", self)
         new_char_action.setToolTip("Create a new character")
         new_char_action.triggered.connect(self.create_new_character)
         toolbar.addAction(new_char_action)
         
         # Open character action
-        open_char_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogOpenButton), "Open", self)
+        open_char_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogOpenButton), "Open", self)
         open_char_action.setToolTip("Open a character file")
         open_char_action.triggered.connect(self.open_character)
         toolbar.addAction(open_char_action)
         
         # Save character action
-        save_char_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton), "Save", self)
+        save_char_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton), "Save", self)
         save_char_action.setToolTip("Save the current character")
         save_char_action.triggered.connect(self.save_character)
         toolbar.addAction(save_char_action)
@@ -530,13 +1270,13 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         
         # Add item action
-        add_item_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton), "Add Item", self)
+        add_item_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogYesButton), "Add Item", self)
         add_item_action.setToolTip("Add a new item to inventory")
         add_item_action.triggered.connect(lambda: self.tabs.setCurrentIndex(1))
         toolbar.addAction(add_item_action)
         
         # Refresh action
-        refresh_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh", self)
+        refresh_action = QAction(standard_icon(QStyle.StandardPixmap.SP_BrowserReload), "Refresh", self)
         refresh_action.setToolTip("Refresh the current view")
         refresh_action.triggered.connect(self.update_ui)
         toolbar.addAction(refresh_action)
@@ -544,7 +1284,7 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
         
         # Help action
-        help_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogHelpButton), "Help", self)
+        help_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogHelpButton), "Help", self)
         help_action.setToolTip("Show help")
         help_action.triggered.connect(self.show_about)
         toolbar.addAction(help_action)
@@ -554,16 +1294,13 @@ class MainWindow(QMainWindow):
     
     def init_ui(self):
         """Initialize the user interface"""
-        # Set application style for a more professional look
-        QApplication.setStyle(QStyleFactory.create("Fusion"))
-        
-        # No need to apply global stylesheet here as it's already applied in main()
+        # Application style and global stylesheet are applied once in main()
         
         self.setWindowTitle("TabletopInventory - Character Management System")
         self.setMinimumSize(1024, 768)
           # Set application icon
         # Note: In a real application, you would use an actual icon file
-        self.setWindowIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
+        self.setWindowIcon(standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView))
         
         # Create central widget with splitter for resizable sections
         central_widget = QWidget()
@@ -586,7 +1323,7 @@ class MainWindow(QMainWindow):
         
         # Character tab
         self.character_tab = QWidget()
-        self.tabs.addTab(self.character_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton), "Character")
+        self.tabs.addTab(self.character_tab, standard_icon(QStyle.StandardPixmap.SP_DialogYesButton), "Character")
         
         character_layout = QVBoxLayout(self.character_tab)
         character_layout.setContentsMargins(10, 10, 10, 10)
@@ -595,31 +1332,30 @@ class MainWindow(QMainWindow):
         # Character selection with styled elements
         char_select_frame = QFrame()
         char_select_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        char_select_frame.setStyleSheet("background-color: rgba(60, 60, 60, 120); border-radius: 5px;")
+        char_select_frame.setObjectName("charSelectFrame")
         character_layout.addWidget(char_select_frame)
         
         char_select_layout = QHBoxLayout(char_select_frame)
         char_select_layout.setContentsMargins(10, 10, 10, 10)
         
         char_label = QLabel("Character:")
-        char_label.setStyleSheet("font-weight: bold; color: #cccccc;")
+        char_label.setObjectName("charSelectLabel")
         self.character_combo = QComboBox()
         self.character_combo.setMinimumWidth(250)
-        self.character_combo.setStyleSheet("padding: 5px;")
         self.character_combo.currentIndexChanged.connect(self.on_character_selected)
         char_select_layout.addWidget(char_label)
         char_select_layout.addWidget(self.character_combo, stretch=1)
         
         # Character buttons with icons
-        self.new_char_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon), " New")
+        self.new_char_btn = QPushButton(standard_icon(QStyle.StandardPixmap.SP_FileIcon), " New")
         self.new_char_btn.setToolTip("Create a new character (Ctrl+N)")
         self.new_char_btn.clicked.connect(self.create_new_character)
         
-        self.delete_char_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon), " Delete")
+        self.delete_char_btn = QPushButton(standard_icon(QStyle.StandardPixmap.SP_TrashIcon), " Delete")
         self.delete_char_btn.setToolTip("Delete the current character (Ctrl+D)")
         self.delete_char_btn.clicked.connect(self.delete_character)
         
-        self.save_char_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton), " Save")
+        self.save_char_btn = QPushButton(standard_icon(QStyle.StandardPixmap.SP_DialogSaveButton), " Save")
         self.save_char_btn.setToolTip("Save the current character (Ctrl+S)")
         self.save_char_btn.clicked.connect(self.save_character)
         
@@ -638,7 +1374,6 @@ class MainWindow(QMainWindow):
         
         # Character details
         char_details_group = QGroupBox("Character Details")
-        char_details_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #555555; border-radius: 5px; margin-top: 10px; padding-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
         char_details_splitter.addWidget(char_details_group)
         
         details_layout = QFormLayout(char_details_group)
@@ -647,15 +1382,14 @@ class MainWindow(QMainWindow):
         
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Enter character name")
-        self.name_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
+        self.name_edit.setProperty("formField", True)
         
         self.game_system_edit = QLineEdit()
         self.game_system_edit.setPlaceholderText("E.g. D&D 5e, Pathfinder, etc.")
-        self.game_system_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
+        self.game_system_edit.setProperty("formField", True)
         
         self.level_spin = QSpinBox()
         self.level_spin.setRange(1, 99)
-        self.level_spin.setStyleSheet("padding: 5px;")
         self.level_spin.setSuffix(" level")
         
         details_layout.setLabelAlignment(Qt.AlignmentFlag.AlignRight)
@@ -667,19 +1401,18 @@ class MainWindow(QMainWindow):
         portrait_layout.setContentsMargins(0, 10, 0, 10)
         
         portrait_title_label = QLabel("Character Portrait")
-        portrait_title_label.setStyleSheet("font-weight: bold; font-size: 10pt; color: #e0e0e0;")
+        portrait_title_label.setObjectName("portraitTitle")
         portrait_title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
           # Create the portrait display with increased size (150% larger)
         self.portrait_label = QLabel()
         self.portrait_label.setFrameShape(QFrame.Shape.StyledPanel)
         self.portrait_label.setMinimumSize(300, 300)
         self.portrait_label.setMaximumSize(300, 300)
-        self.portrait_label.setStyleSheet("background-color: #333333; border: 1px solid #6A9DDF; border-radius: 4px;")
+        self.portrait_label.setObjectName("portraitLabel")
         self.portrait_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.portrait_label.setScaledContents(True)
           # Add a button to change portrait
         change_portrait_btn = QPushButton("Change Portrait")
-        change_portrait_btn.setStyleSheet("padding: 5px 10px;")
+        change_portrait_btn.setObjectName("changePortraitButton")
         change_portrait_btn.clicked.connect(self.change_character_portrait)
         
         # Add the portrait elements to the layout
@@ -697,7 +1430,6 @@ class MainWindow(QMainWindow):
         
         # Currency group with styled spinboxes
         currency_group = QGroupBox("Currency")
-        currency_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #555555; border-radius: 5px; margin-top: 10px; padding-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
         char_details_splitter.addWidget(currency_group)
         
         currency_layout = QGridLayout(currency_group)
@@ -707,22 +1439,22 @@ class MainWindow(QMainWindow):
         # Currency spinboxes with custom styling
         self.platinum_spin = QSpinBox()
         self.platinum_spin.setRange(0, 999999)
-        self.platinum_spin.setStyleSheet("padding: 5px; background: rgba(220, 220, 255, 30);")
+        self.platinum_spin.setObjectName("platinumSpin")
         self.platinum_spin.setPrefix("🟪 ")
         
         self.gold_spin = QSpinBox()
         self.gold_spin.setRange(0, 999999)
-        self.gold_spin.setStyleSheet("padding: 5px; background: rgba(255, 255, 0, 30);")
+        self.gold_spin.setObjectName("goldSpin")
         self.gold_spin.setPrefix("🟨 ")
         
         self.silver_spin = QSpinBox()
         self.silver_spin.setRange(0, 999999)
-        self.silver_spin.setStyleSheet("padding: 5px; background: rgba(200, 200, 200, 30);")
+        self.silver_spin.setObjectName("silverSpin")
         self.silver_spin.setPrefix("⬜ ")
         
         self.copper_spin = QSpinBox()
         self.copper_spin.setRange(0, 999999)
-        self.copper_spin.setStyleSheet("padding: 5px; background: rgba(180, 100, 0, 30);")
+        self.copper_spin.setObjectName("copperSpin")
         self.copper_spin.setPrefix("🟧 ")        # Add widgets to currency layout
         currency_layout.addWidget(QLabel("<b>Platinum:</b>"), 0, 0)
         currency_layout.addWidget(self.platinum_spin, 0, 1)
@@ -732,6 +1464,15 @@ class MainWindow(QMainWindow):
         currency_layout.addWidget(self.silver_spin, 2, 1)
         currency_layout.addWidget(QLabel("<b>Copper:</b>"), 3, 0)
         currency_layout.addWidget(self.copper_spin, 3, 1)
+        
+        # Keep the total in step with the spin boxes, refreshing once they
+        # settle rather than on every step of a scroll or key repeat
+        self.currency_total_timer = QTimer(self)
+        self.currency_total_timer.setSingleShot(True)
+        self.currency_total_timer.setInterval(80)
+        self.currency_total_timer.timeout.connect(self.update_currency_total)
+        for spin in (self.platinum_spin, self.gold_spin, self.silver_spin, self.copper_spin):
+            spin.valueChanged.connect(lambda _value: self.currency_total_timer.start())
           
         # Create a container for the total currency display
         total_currency_container = QWidget()
@@ -740,21 +1481,10 @@ class MainWindow(QMainWindow):
           # Create custom widget for total currency display with background image
         total_currency_frame = QFrame()
         total_currency_frame.setMinimumHeight(60)
-        total_currency_frame.setStyleSheet("""
-            border: none;
-            border-radius: 5px;
-        """)
+        total_currency_frame.setObjectName("totalCurrencyFrame")
           # Create the total currency label
         self.total_currency_label = QLabel("Total Value: 0.00 gold 🪙")
-        self.total_currency_label.setStyleSheet("""            font-weight: bold; 
-            font-size: 18pt; 
-            color: #FFD700;
-            background: rgba(30, 30, 30, 150);
-            border-radius: 8px;
-            padding: 8px 18px;
-            margin-right: 100px;
-            /* Removed text-shadow property that was causing warnings */
-        """)
+        self.total_currency_label.setObjectName("totalCurrencyLabel")
         self.total_currency_label.setAlignment(Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft)
         
         # Create a layout for the frame
@@ -768,7 +1498,7 @@ class MainWindow(QMainWindow):
         # Add a background frame for the total display
         total_frame = QFrame()
         total_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        total_frame.setStyleSheet("background-color: rgba(30, 30, 30, 180); border-radius: 5px;")
+        total_frame.setObjectName("totalCurrencyPanel")
         
         # Add the container to the frame
         total_frame_layout = QVBoxLayout(total_frame)
@@ -800,7 +1530,7 @@ class MainWindow(QMainWindow):
         
         # Inventory tab with enhanced styling
         self.inventory_tab = QWidget()
-        self.tabs.addTab(self.inventory_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView), "Inventory")
+        self.tabs.addTab(self.inventory_tab, standard_icon(QStyle.StandardPixmap.SP_FileDialogListView), "Inventory")
         
         inventory_layout = QVBoxLayout(self.inventory_tab)
         inventory_layout.setContentsMargins(10, 10, 10, 10)
@@ -808,7 +1538,6 @@ class MainWindow(QMainWindow):
         
         # Add item section with grid layout
         add_item_group = QGroupBox("Add New Item")
-        add_item_group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #555555; border-radius: 5px; margin-top: 10px; padding-top: 10px; } QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 5px; }")
         inventory_layout.addWidget(add_item_group)
         
         add_item_layout = QGridLayout(add_item_group)
@@ -817,58 +1546,44 @@ class MainWindow(QMainWindow):
         
         self.item_name_edit = QLineEdit()
         self.item_name_edit.setPlaceholderText("Item name")
-        self.item_name_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
+        self.item_name_edit.setProperty("formField", True)
         
         self.item_desc_edit = QLineEdit()
         self.item_desc_edit.setPlaceholderText("Short description")
-        self.item_desc_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
+        self.item_desc_edit.setProperty("formField", True)
         
         self.item_quantity_spin = QSpinBox()
         self.item_quantity_spin.setRange(1, 9999)
-        self.item_quantity_spin.setStyleSheet("padding: 5px;")
         
         self.item_weight_spin = QDoubleSpinBox()
         self.item_weight_spin.setRange(0, 9999.99)
         self.item_weight_spin.setSingleStep(0.1)
         self.item_weight_spin.setSuffix(" lb")
-        self.item_weight_spin.setStyleSheet("padding: 5px;")
         
         self.item_value_spin = QDoubleSpinBox()
         self.item_value_spin.setRange(0, 9999.99)
         self.item_value_spin.setSingleStep(0.1)
         self.item_value_spin.setSuffix(" gp")
-        self.item_value_spin.setStyleSheet("padding: 5px;")
         
         self.item_rarity_combo = QComboBox()
-        self.item_rarity_combo.setStyleSheet("padding: 5px;")
-        
-        # Add color indicators for item rarity
-        rarity_colors = {
-            "COMMON": "#aaaaaa",
-            "UNCOMMON": "#1eff00", 
-            "RARE": "#0070dd", 
-            "VERY_RARE": "#a335ee", 
-            "LEGENDARY": "#ff8000",
-            "ARTIFACT": "#e6cc80"
-        }
+        self.item_rarity_combo.addItems(_RARITY_FROM_DISPLAY)
         
+        # Add color indicators for item rarity; combo rows follow enum order
         for rarity in ItemRarity:
-            self.item_rarity_combo.addItem(rarity.name.capitalize())
             self.item_rarity_combo.setItemData(
-                self.item_rarity_combo.count() - 1, 
-                QColor(rarity_colors.get(rarity.name, "#aaaaaa")), 
+                rarity,
+                InventoryModel.RARITY_COLORS[rarity],
                 Qt.ItemDataRole.ForegroundRole
             )
         
         # Equipped checkbox
         self.item_equipped_check = QComboBox()
         self.item_equipped_check.addItems(["Not Equipped", "Equipped"])
-        self.item_equipped_check.setStyleSheet("padding: 5px;")
         
         # Tags field
         self.item_tags_edit = QLineEdit()
         self.item_tags_edit.setPlaceholderText("Tags (comma separated)")
-        self.item_tags_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
+        self.item_tags_edit.setProperty("formField", True)
         
         add_item_layout.addWidget(QLabel("<b>Name:</b>"), 0, 0)
         add_item_layout.addWidget(self.item_name_edit, 0, 1, 1, 3)
@@ -892,12 +1607,12 @@ class MainWindow(QMainWindow):
         add_item_layout.addLayout(item_buttons_layout, 5, 0, 1, 4)
         
         # Add item button with icon
-        add_item_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogYesButton), " Add Item")
-        add_item_btn.setStyleSheet("padding: 5px; font-weight: bold;")
+        add_item_btn = QPushButton(standard_icon(QStyle.StandardPixmap.SP_DialogYesButton), " Add Item")
+        add_item_btn.setObjectName("addItemButton")
         add_item_btn.clicked.connect(self.add_item)
         
         # Clear form button
-        clear_form_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogResetButton), " Clear Form")
+        clear_form_btn = QPushButton(standard_icon(QStyle.StandardPixmap.SP_DialogResetButton), " Clear Form")
         clear_form_btn.clicked.connect(self.clear_item_form)
         
         item_buttons_layout.addStretch(1)
@@ -910,17 +1625,22 @@ class MainWindow(QMainWindow):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search items...")
-        self.search_edit.setStyleSheet("padding: 5px; border-radius: 3px;")
-        self.search_edit.textChanged.connect(self.filter_inventory)
+        self.search_edit.setProperty("formField", True)
+        # Filter once typing pauses rather than on every keystroke;
+        # textEdited ignores programmatic changes such as clear()
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(200)
+        self.filter_timer.timeout.connect(self.filter_inventory)
+        self.search_edit.textEdited.connect(lambda _text: self.filter_timer.start())
         
         self.filter_rarity_combo = QComboBox()
         self.filter_rarity_combo.addItem("All Rarities")
-        for rarity in ItemRarity:
-            self.filter_rarity_combo.addItem(rarity.name.capitalize())
+        self.filter_rarity_combo.addItems(_RARITY_FROM_DISPLAY)
         self.filter_rarity_combo.currentIndexChanged.connect(self.filter_inventory)
         
         self.sort_by_combo = QComboBox()
-        self.sort_by_combo.addItems(["Name", "Quantity", "Weight", "Value", "Rarity"])
+        self.sort_by_combo.addItems(self.SORT_KEYS)
         self.sort_by_combo.currentIndexChanged.connect(self.filter_inventory)
         
         filter_layout.addWidget(QLabel("Search:"))
@@ -930,33 +1650,41 @@ class MainWindow(QMainWindow):
         filter_layout.addWidget(QLabel("Sort by:"))
         filter_layout.addWidget(self.sort_by_combo, stretch=1)
         
-        # Enhanced inventory table
-        self.inventory_table = QTableWidget(0, 7)
-        self.inventory_table.setHorizontalHeaderLabels(["Name", "Quantity", "Weight", "Value", "Rarity", "Description", "Actions"])
+        # Enhanced inventory table, backed by a model instead of per-cell items
+        self.inventory_model = InventoryModel(self)
+        self.inventory_table = QTableView()
+        self.inventory_table.setModel(self.inventory_model)
         self.inventory_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
         self.inventory_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)
-        self.inventory_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.inventory_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        # Size columns from a sample of rows so resets and row inserts on a
+        # large inventory don't measure every cell
+        self.inventory_table.horizontalHeader().setResizeContentsPrecision(self.RESIZE_SAMPLE_ROWS)
+        self.inventory_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.inventory_table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.inventory_table.setAlternatingRowColors(True)
-        self.inventory_table.setStyleSheet("QTableWidget { gridline-color: #444444; alternate-background-color: #383838; }")
+        self.inventory_table.setObjectName("inventoryTable")
+        
+        # Delete buttons are painted by a delegate rather than a widget per row.
+        # The removal is queued so the table is not rebuilt inside its own
+        # mouse event handler.
+        self.delete_delegate = DeleteButtonDelegate(standard_icon(QStyle.StandardPixmap.SP_TrashIcon), self.inventory_table)
+        self.delete_delegate.delete_requested.connect(self.remove_item, Qt.ConnectionType.QueuedConnection)
+        self.inventory_table.setItemDelegateForColumn(InventoryModel.ACTIONS_COLUMN, self.delete_delegate)
         inventory_layout.addWidget(self.inventory_table, stretch=1)
         
         # Inventory summary with enhanced styling
         summary_frame = QFrame()
         summary_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        summary_frame.setStyleSheet("background-color: rgba(60, 60, 60, 120); border-radius: 5px; padding: 5px;")
+        summary_frame.setObjectName("inventorySummary")
         inventory_layout.addWidget(summary_frame)
         summary_layout = QHBoxLayout(summary_frame)
         summary_layout.setContentsMargins(10, 10, 10, 10)
         
         self.total_items_label = QLabel("Total Items: 0")
-        self.total_items_label.setStyleSheet("font-weight: bold;")
         
         self.total_weight_label = QLabel("Total Weight: 0.0 lb")
-        self.total_weight_label.setStyleSheet("font-weight: bold;")
         
         self.total_value_label = QLabel("Total Value: 0.0 gp")
-        self.total_value_label.setStyleSheet("font-weight: bold;")
         
         summary_layout.addWidget(self.total_items_label)
         summary_layout.addStretch(1)
@@ -966,7 +1694,7 @@ class MainWindow(QMainWindow):
         
         # Notes tab with enhanced text editor
         self.notes_tab = QWidget()
-        self.tabs.addTab(self.notes_tab, self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Notes")
+        self.tabs.addTab(self.notes_tab, standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Notes")
         
         notes_layout = QVBoxLayout(self.notes_tab)
         notes_layout.setContentsMargins(10, 10, 10, 10)
@@ -984,21 +1712,21 @@ class MainWindow(QMainWindow):
         # Enhanced text editor
         self.notes_edit = QTextEdit()
         self.notes_edit.setPlaceholderText("Enter character notes here...")
-        self.notes_edit.setStyleSheet("padding: 8px; border-radius: 3px; line-height: 1.3;")
+        self.notes_edit.setObjectName("notesEdit")
         font = QFont("Segoe UI", 10)
         self.notes_edit.setFont(font)
         
         # Add comprehensive formatting toolbar for notes
         notes_toolbar = QToolBar("Notes Toolbar")
         notes_toolbar.setIconSize(QSize(16, 16))
-        notes_toolbar.setStyleSheet("QToolBar { spacing: 2px; background-color: #333333; border-radius: 3px; }")
+        notes_toolbar.setObjectName("notesToolbar")
           # Text style section
-        bold_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarNormalButton), "Bold", self)
+        bold_action = QAction(standard_icon(QStyle.StandardPixmap.SP_TitleBarNormalButton), "Bold", self)
         bold_action.setShortcut(QKeySequence("Ctrl+B"))
         bold_action.setToolTip("Bold Text (Ctrl+B)")
         bold_action.triggered.connect(lambda: self.notes_edit.insertPlainText("**Bold Text**"))
         
-        italic_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_TitleBarShadeButton), "Italic", self)
+        italic_action = QAction(standard_icon(QStyle.StandardPixmap.SP_TitleBarShadeButton), "Italic", self)
         italic_action.setShortcut(QKeySequence("Ctrl+I"))
         italic_action.setToolTip("Italic Text (Ctrl+I)")
         italic_action.triggered.connect(lambda: self.notes_edit.insertPlainText("*Italic Text*"))
@@ -1011,7 +1739,7 @@ class MainWindow(QMainWindow):
         strikethrough_action.setToolTip("Strikethrough Text")
         strikethrough_action.triggered.connect(lambda: self.notes_edit.insertPlainText("~~Strikethrough Text~~"))
         
-        code_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileIcon), "Code", self)
+        code_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileIcon), "Code", self)
         code_action.setToolTip("Code Text")
         code_action.triggered.connect(lambda: self.notes_edit.insertPlainText("`Code Text`"))
         
@@ -1029,35 +1757,35 @@ class MainWindow(QMainWindow):
         heading3_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n### Heading 3 ###\n"))
         
         # List section
-        bullet_list_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView), "Bullet List", self)
+        bullet_list_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileDialogListView), "Bullet List", self)
         bullet_list_action.setToolTip("Bullet List")
         bullet_list_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n- List item\n- Another item\n- Third item\n"))
         
-        numbered_list_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogListView), "Numbered List", self)
+        numbered_list_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileDialogListView), "Numbered List", self)
         numbered_list_action.setToolTip("Numbered List")
         numbered_list_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n1. First item\n2. Second item\n3. Third item\n"))
         
-        checklist_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton), "Checklist", self)
+        checklist_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogApplyButton), "Checklist", self)
         checklist_action.setToolTip("Checklist")
         checklist_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n- [ ] Task to do\n- [x] Completed task\n- [ ] Another task\n"))
         
         # Dividers section        # Using a generic icon since specialized separator icons don't exist in this version of PyQt
-        separator_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowDown), "Separator", self)
+        separator_action = QAction(standard_icon(QStyle.StandardPixmap.SP_ArrowDown), "Separator", self)
         separator_action.setToolTip("Horizontal Separator")
         separator_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n---\n"))
         
         # Blocks section
-        quote_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxInformation), "Quote", self)
+        quote_action = QAction(standard_icon(QStyle.StandardPixmap.SP_MessageBoxInformation), "Quote", self)
         quote_action.setToolTip("Quote Block")
         quote_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n> This is a quote or important note\n> It can span multiple lines\n"))
         
-        code_block_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Code Block", self)
+        code_block_action = QAction(standard_icon(QStyle.StandardPixmap.SP_FileDialogDetailedView), "Code Block", self)
         code_block_action.setToolTip("Code Block")
         code_block_action.triggered.connect(lambda: self.notes_edit.insertPlainText("\n```\nCode block\nfor multi-line code\n```\n"))
         
         # Templates menu
         templates_menu = QMenu("Templates")
-        templates_menu.setStyleSheet("QMenu { background-color: #333333; border: 1px solid #555555; }")
+        templates_menu.setObjectName("templatesMenu")
         
         character_template_action = QAction("Character Bio", self)
         character_template_action.triggered.connect(self.insert_character_template)
@@ -1079,7 +1807,7 @@ class MainWindow(QMainWindow):
         templates_action.setMenu(templates_menu)
         
         # Utility actions
-        clear_notes_action = QAction(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogResetButton), "Clear", self)
+        clear_notes_action = QAction(standard_icon(QStyle.StandardPixmap.SP_DialogResetButton), "Clear", self)
         clear_notes_action.setToolTip("Clear Notes")
         clear_notes_action.triggered.connect(self.notes_edit.clear)
         
@@ -1124,17 +1852,21 @@ class MainWindow(QMainWindow):
         
         preview_label = QLabel("Notes Preview")
         preview_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        preview_label.setStyleSheet("font-weight: bold; background-color: #333333; padding: 5px;")
+        preview_label.setObjectName("notesPreviewTitle")
         
         self.notes_preview = QTextEdit()
         self.notes_preview.setReadOnly(True)
-        self.notes_preview.setStyleSheet("background-color: #2a2a2a; padding: 10px; border-radius: 3px;")
+        self.notes_preview.setObjectName("notesPreview")
         
         preview_layout.addWidget(preview_label)
         preview_layout.addWidget(self.notes_preview)
         
-        # Connect preview update
-        self.notes_edit.textChanged.connect(self.update_notes_preview)
+        # Re-render the preview once typing pauses rather than on every keystroke
+        self.notes_preview_timer = QTimer(self)
+        self.notes_preview_timer.setSingleShot(True)
+        self.notes_preview_timer.setInterval(300)
+        self.notes_preview_timer.timeout.connect(self.update_notes_preview)
+        self.notes_edit.textChanged.connect(self.notes_preview_timer.start)
         
         notes_splitter.addWidget(preview_container)
         
@@ -1143,7 +1875,6 @@ class MainWindow(QMainWindow):
         
         # Set up menu bar with enhanced options
         menu_bar = self.menuBar()
-        menu_bar.setStyleSheet("QMenuBar { background-color: #2d2d2d; } QMenuBar::item:selected { background-color: #3d3d3d; }")
         
         file_menu = menu_bar.addMenu("File")
         
@@ -1172,29 +1903,31 @@ class MainWindow(QMainWindow):
         help_menu.addAction(about_action)
           # Set up enhanced status bar
         self.status_bar = self.statusBar()
-        self.status_bar.setStyleSheet("QStatusBar { border-top: 1px solid #555555; }")
         
         # Add permanent widgets to status bar
-        self.last_saved_label = QLabel("No character loaded")
-        self.last_saved_label.setStyleSheet("padding: 2px 10px; border-right: 1px solid #555555;")
-        self.status_bar.addPermanentWidget(self.last_saved_label)
-        
-        self.item_count_label = QLabel("Items: 0")
-        self.item_count_label.setStyleSheet("padding: 2px 10px; border-right: 1px solid #555555;")
-        self.status_bar.addPermanentWidget(self.item_count_label)
-        
-        self.total_weight_status_label = QLabel("Weight: 0.0 lb")
-        self.total_weight_status_label.setStyleSheet("padding: 2px 10px;")
-        self.status_bar.addPermanentWidget(self.total_weight_status_label)
+        for attr, text in self.STATUS_LABELS:
+            label = QLabel(text)
+            self.status_bar.addPermanentWidget(label)
+            setattr(self, attr, label)
+        label.setProperty("last", True)
         
         self.status_bar.showMessage("Ready")
     
     def load_characters(self):
         """Load all characters from save directory"""
-        self.character_combo.clear()
-        characters = self.character_manager.load_all_characters()
-        for character in characters:
-            self.character_combo.addItem(character.name, character.id)
+        # Fill the combo silently, then select once, rather than letting
+        # clear() and the first addItem each trigger a full UI refresh
+        combo = self.character_combo
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            # Only names are needed here; characters are loaded when selected
+            for character_id, name in self.character_manager.list_characters():
+                combo.addItem(name, character_id)
+        finally:
+            combo.blockSignals(False)
+        self.on_character_selected(combo.currentIndex())
+    
     def on_character_selected(self, index):
         """Handle character selection"""
         if index < 0:
@@ -1203,11 +1936,13 @@ class MainWindow(QMainWindow):
             return
         
         character_id = self.character_combo.itemData(index)
-        self.current_character = self.character_manager.characters.get(character_id)
+        self.current_character = self.character_manager.get_character(character_id)
         self.update_ui()
     
     def update_ui(self):
         """Update UI with current character data"""
+        # Any queued refresh would only repeat this one
+        self.ui_update_timer.stop()
         if not self.current_character:
             # Clear UI
             self.name_edit.setText("")
@@ -1220,7 +1955,7 @@ class MainWindow(QMainWindow):
             self.total_currency_label.setText("Total Value: 0.00 gold 🪙")
             self.notes_edit.clear()
             self.notes_preview.clear()
-            self.inventory_table.setRowCount(0)
+            self.inventory_model.set_items([])
             self.total_items_label.setText("Total Items: 0")
             self.total_weight_label.setText("Total Weight: 0.0 lb")
             self.total_value_label.setText("Total Value: 0.0 gp")
@@ -1247,10 +1982,10 @@ class MainWindow(QMainWindow):
         self.gold_spin.setValue(self.current_character.currency.gold)
         self.silver_spin.setValue(self.current_character.currency.silver)
         self.copper_spin.setValue(self.current_character.currency.copper)
-        # Update total currency - convert to gold (100 copper = 1 gold)
-        total_copper = self.current_character.currency.total_in_copper()
-        total_gold = total_copper / 100
-        self.total_currency_label.setText(f"Total Value: {total_gold:.2f} gold 🪙")
+        # Update total currency now; the refresh queued by the spin boxes
+        # above would only repeat it
+        self.currency_total_timer.stop()
+        self.update_currency_total()
         
         # Enable currency converter
         self.convert_button.setEnabled(True)
@@ -1259,6 +1994,7 @@ class MainWindow(QMainWindow):
         self.convert_to_combo.setEnabled(True)
           # Update notes - now using QTextEdit with preview
         self.notes_edit.setPlainText(self.current_character.notes)
+        self.notes_preview_timer.stop()
         self.update_notes_preview()
         
         # Update character portrait if available
@@ -1273,101 +2009,48 @@ class MainWindow(QMainWindow):
     
     def update_inventory_table(self):
         """Update inventory table with current character's items"""
+        self._clear_filter_cache()
         if not self.current_character:
-            self.inventory_table.setRowCount(0)
+            self.inventory_model.set_items([])
             return
         
-        # Rarity colors for better visual distinction
-        rarity_colors = {
-            ItemRarity.COMMON: "#aaaaaa",
-            ItemRarity.UNCOMMON: "#1eff00", 
-            ItemRarity.RARE: "#0070dd", 
-            ItemRarity.VERY_RARE: "#a335ee", 
-            ItemRarity.LEGENDARY: "#ff8000",
-            ItemRarity.ARTIFACT: "#e6cc80"
-        }
-        
-        # Background colors (more subtle)
-        rarity_bg_colors = {
-            ItemRarity.COMMON: "rgba(170, 170, 170, 20)",
-            ItemRarity.UNCOMMON: "rgba(30, 255, 0, 20)", 
-            ItemRarity.RARE: "rgba(0, 112, 221, 20)", 
-            ItemRarity.VERY_RARE: "rgba(163, 53, 238, 20)", 
-            ItemRarity.LEGENDARY: "rgba(255, 128, 0, 20)",
-            ItemRarity.ARTIFACT: "rgba(230, 204, 128, 20)"
-        }
-        
-        # Disconnect signals to prevent recursion
-        self.inventory_table.blockSignals(True)
-        
-        # Clear table
-        self.inventory_table.setRowCount(0)
-        
-        # Add items
-        for i, item in enumerate(self.current_character.inventory):
-            self.inventory_table.insertRow(i)
-            
-            # Item name
-            name_item = QTableWidgetItem(item.name)
-            name_item.setForeground(QColor(rarity_colors.get(item.rarity, "#ffffff")))
-            
-            # Apply some styling to the entire row based on rarity
-            for col in range(6):
-                cell_item = QTableWidgetItem("")
-                if col == 0:
-                    cell_item = name_item
-                elif col == 1:
-                    cell_item = QTableWidgetItem(str(item.quantity))
-                elif col == 2:
-                    cell_item = QTableWidgetItem(f"{item.weight:.1f}")
-                elif col == 3:
-                    cell_item = QTableWidgetItem(f"{item.value:.1f}")
-                elif col == 4:
-                    cell_item = QTableWidgetItem(item.rarity.name.capitalize())
-                    cell_item.setForeground(QColor(rarity_colors.get(item.rarity, "#ffffff")))
-                elif col == 5:
-                    cell_item = QTableWidgetItem(item.description)
-                
-                # Apply background color based on rarity
-                cell_item.setData(Qt.ItemDataRole.UserRole, item.id)
-                self.inventory_table.setItem(i, col, cell_item)
-                
-                # Apply background styling
-                self.inventory_table.item(i, col).setBackground(QColor(rarity_bg_colors.get(item.rarity, "#2A2A2A")))
-                
-                # Make the text for common items a bit brighter for better contrast
-                if item.rarity == ItemRarity.COMMON:
-                    self.inventory_table.item(i, col).setForeground(QColor("#cccccc"))
-            
-            # Actions - create a better-styled delete button
-            delete_btn = QPushButton(self.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon), "")
-            delete_btn.setToolTip("Remove this item")
-            delete_btn.setStyleSheet("""
-                QPushButton {
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    padding: 3px;
-                    background-color: #3A3A3A;
-                }
-                QPushButton:hover {
-                    background-color: #cc4444;
-                    border-color: #ff5555;
-                }
-            """)
-            delete_btn.clicked.connect(lambda _, item_id=item.id: self.remove_item(item_id))
-            self.inventory_table.setCellWidget(i, 6, delete_btn)
-        
-        # Re-enable signals
-        self.inventory_table.blockSignals(False)
-        
-        # Update inventory summary
-        total_items = sum(item.quantity for item in self.current_character.inventory)
-        total_weight = self.current_character.total_weight()
-        total_value = self.current_character.total_value()
-        
-        self.total_items_label.setText(f"Total Items: {total_items}")
-        self.total_weight_label.setText(f"Total Weight: {total_weight:.1f} lb")
-        self.total_value_label.setText(f"Total Value: {total_value:.1f} gp")
+        self.inventory_model.set_items(self.current_character.inventory)
+        self._update_inventory_summary()
+    
+    def _append_inventory_row(self, item):
+        """Add a table row for a newly added item without a full rebuild"""
+        self._clear_filter_cache()
+        self._update_inventory_summary()
+        if self._filter_active():
+            # The new item may not match, so let the filter decide what shows
+            self.filter_inventory()
+        else:
+            self.inventory_model.append_item(item)
+    
+    def _remove_inventory_row(self, item):
+        """Remove the table row of a removed item without a full rebuild"""
+        self._clear_filter_cache()
+        self._update_inventory_summary()
+        if self._filter_active():
+            self.filter_inventory()
+        else:
+            self.inventory_model.remove_item(item.id)
+    
+    def _filter_active(self):
+        """Whether a search or rarity filter is narrowing the inventory table"""
+        return bool(self.search_edit.text()) or self.filter_rarity_combo.currentIndex() != 0
+    
+    def _clear_filter_cache(self):
+        """Forget cached filter and sort results after the inventory changes"""
+        self._filter_cache.clear()
+        self._sorted_inventory.clear()
+    
+    def _update_inventory_summary(self):
+        """Show the running inventory totals in the summary labels"""
+        character = self.current_character
+        self.total_items_label.setText(f"Total Items: {character.total_quantity()}")
+        self.total_weight_label.setText(f"Total Weight: {character.total_weight():.1f} lb")
+        self.total_value_label.setText(f"Total Value: {character.total_value():.1f} gp")
     
     def create_new_character(self):
         """Create a new character"""
@@ -1404,6 +2087,10 @@ class MainWindow(QMainWindow):
             character_id = self.current_character.id
             character_name = self.current_character.name
             
+            # A save still queued for the character would write its file
+            # back after deletion, so let it finish first
+            self.save_pool.waitForDone()
+            
             # Delete character
             if self.character_manager.delete_character(character_id):
                 # Remove from combo box
@@ -1417,37 +2104,58 @@ class MainWindow(QMainWindow):
         if not self.current_character:
             return
         
-        # Update character with UI data
-        self.current_character.name = self.name_edit.text()
-        self.character_combo.setItemText(self.character_combo.currentIndex(), self.current_character.name)
-        
-        self.current_character.game_system = self.game_system_edit.text()
-        self.current_character.level = self.level_spin.value()
-          # Update currency
-        self.current_character.currency.platinum = self.platinum_spin.value()
-        self.current_character.currency.gold = self.gold_spin.value()
-        self.current_character.currency.silver = self.silver_spin.value()
-        self.current_character.currency.copper = self.copper_spin.value()          
-        # Update total currency display - convert to gold
-        total_copper = self.current_character.currency.total_in_copper()
-        total_gold = total_copper / 100
-        self.total_currency_label.setText(f"Total Value: {total_gold:.2f} gold 🪙")
-        
-        # Update notes - now using QTextEdit instead of QLineEdit
-        self.current_character.notes = self.notes_edit.toPlainText()
+        character = self.current_character
+        
+        # Update character with UI data, flagging only fields that changed
+        # (notes now use a QTextEdit instead of a QLineEdit)
+        ui_values = (
+            (character, "name", self.name_edit.text()),
+            (character, "game_system", self.game_system_edit.text()),
+            (character, "level", self.level_spin.value()),
+            (character, "notes", self.notes_edit.toPlainText()),
+            (character.currency, "platinum", self.platinum_spin.value()),
+            (character.currency, "gold", self.gold_spin.value()),
+            (character.currency, "silver", self.silver_spin.value()),
+            (character.currency, "copper", self.copper_spin.value()),
+        )
+        for target, attr, value in ui_values:
+            if getattr(target, attr) != value:
+                setattr(target, attr, value)
+                character.mark_dirty()
+        
+        self.character_combo.setItemText(self.character_combo.currentIndex(), character.name)
         
         # Portrait is updated separately in change_character_portrait method
         
-        # Update timestamp
-        self.current_character.updated_at = datetime.now().isoformat()
+        # Save to file; encoding and disk I/O happen on the save pool
+        job = self.character_manager.prepare_save(character.id)
+        if job is None:
+            self.status_bar.showMessage(f"Saved character: {character.name}")
+            self.update_status()
+            return
         
-        # Save to file
-        if self.character_manager.save_character(self.current_character.id):
-            self.status_bar.showMessage(f"Saved character: {self.current_character.name}")
+        task = SaveTask(self.character_manager, character.id, job)
+        task.signals.finished.connect(self.on_save_finished)
+        self._save_tasks.add(task)
+        self.save_pool.start(task)
+    
+    def on_save_finished(self, task, saved):
+        """Report the result of a background save"""
+        self._save_tasks.discard(task)
+        self.character_manager.finish_save(task.character_id, task.job, saved)
+        
+        if saved:
+            self.status_bar.showMessage(f"Saved character: {task.job[1]['name']}")
             self.update_status()  # Update the last saved timestamp in status bar
         else:
             self.status_bar.showMessage("Error saving character")
     
+    def closeEvent(self, event):
+        """Let pending saves finish before the window closes"""
+        self.save_pool.waitForDone()
+        QApplication.processEvents()  # Deliver their finished signals
+        super().closeEvent(event)
+    
     def open_character(self):
         """Open a character file"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -1490,7 +2198,7 @@ class MainWindow(QMainWindow):
         quantity = self.item_quantity_spin.value()
         weight = self.item_weight_spin.value()
         value = self.item_value_spin.value()
-        rarity = ItemRarity[self.item_rarity_combo.currentText().upper()]
+        rarity = _RARITY_FROM_DISPLAY[self.item_rarity_combo.currentText()]
         
         # Create item
         item = Item(
@@ -1507,7 +2215,7 @@ class MainWindow(QMainWindow):
         self.current_character.add_item(item)
         
         # Update UI
-        self.update_inventory_table()
+        self._append_inventory_row(item)
         
         # Clear inputs
         self.item_name_edit.clear()
@@ -1527,7 +2235,7 @@ class MainWindow(QMainWindow):
         
         if item:
             # Update UI
-            self.update_inventory_table()
+            self._remove_inventory_row(item)
             
             self.status_bar.showMessage(f"Removed item: {item.name}")
     
@@ -1540,55 +2248,43 @@ class MainWindow(QMainWindow):
         from_type = self.convert_from_combo.currentText().lower()
         to_type = self.convert_to_combo.currentText().lower()
         
-        # Convert everything to copper first
-        copper_values = {
-            "copper": 1,
-            "silver": 10,
-            "gold": 100,
-            "platinum": 1000
-        }
-        
-        total_copper = amount * copper_values[from_type]
-        result = total_copper / copper_values[to_type]
+        # Convert everything to copper first, in whole coins; whatever does
+        # not make up a full coin of the target stays in the original coins
+        from_value = Currency.COPPER_VALUES[from_type]
+        result, remainder = divmod(amount * from_value, Currency.COPPER_VALUES[to_type])
+        spent = amount - remainder // from_value
         
-        # Show result in a message box
-        QMessageBox.information(
-            self,
-            "Currency Conversion",
-            f"{amount} {from_type} = {result:.2f} {to_type}"
-        )
+        summary = f"{amount} {from_type} = {result} {to_type}"
+        if remainder:
+            summary += f" with {amount - spent} {from_type} left over"
         
-        # Apply conversion to character's currency if confirmed
+        # Show the result and apply it to the character's currency if confirmed
         reply = QMessageBox.question(
             self,
-            "Apply Conversion?",
-            f"Would you like to subtract {amount} {from_type} and add {int(result)} {to_type} to your character's currency?",
+            "Currency Conversion",
+            f"{summary}\n\n"
+            f"Would you like to subtract {spent} {from_type} and add {result} {to_type} to your character's currency?",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            # Subtract the original currency
-            if from_type == "copper":
-                self.current_character.currency.copper -= amount
-            elif from_type == "silver":
-                self.current_character.currency.silver -= amount
-            elif from_type == "gold":
-                self.current_character.currency.gold -= amount
-            elif from_type == "platinum":
-                self.current_character.currency.platinum -= amount
-                
-            # Add the converted currency
-            if to_type == "copper":
-                self.current_character.currency.copper += int(result)
-            elif to_type == "silver":
-                self.current_character.currency.silver += int(result)
-            elif to_type == "gold":
-                self.current_character.currency.gold += int(result)
-            elif to_type == "platinum":
-                self.current_character.currency.platinum += int(result)
+            # Subtract the coins used and add the converted amount;
+            # the combo texts are the Currency field names
+            currency = self.current_character.currency
+            setattr(currency, from_type, getattr(currency, from_type) - spent)
+            setattr(currency, to_type, getattr(currency, to_type) + result)
+            
+            self.current_character.mark_dirty()
                 
-            # Update UI
-            self.update_ui()
+            # Update UI once control returns to the event loop
+            self.ui_update_timer.start()
+    
+    def update_currency_total(self):
+        """Show the total of the currency spin boxes in gold"""
+        values = (self.platinum_spin.value(), self.gold_spin.value(),
+                  self.silver_spin.value(), self.copper_spin.value())
+        total_copper = sum(map(mul, Currency.COPPER_RATES, values))
+        self.total_currency_label.setText(f"Total Value: {total_copper / 100:.2f} gold 🪙")
     
     def update_status(self):
         """Update the status bar with current information"""
@@ -1598,16 +2294,19 @@ class MainWindow(QMainWindow):
             self.total_weight_status_label.setText("Weight: 0.0 lb")
             return
         
-        # Format the last saved time nicely
-        try:
-            saved_dt = datetime.fromisoformat(self.current_character.updated_at)
-            last_saved = saved_dt.strftime("%Y-%m-%d %H:%M:%S")
-            self.last_saved_label.setText(f"Last saved: {last_saved}")
-        except (ValueError, TypeError):
-            self.last_saved_label.setText("Last saved: Unknown")
+        # Format the last saved time nicely, reparsing only when it changed
+        updated_at = self.current_character.updated_at
+        if updated_at != self._last_saved_text[0]:
+            try:
+                saved_dt = datetime.fromisoformat(updated_at)
+                last_saved = f"Last saved: {saved_dt.strftime(_TIMESTAMP_FORMAT)}"
+            except (ValueError, TypeError):
+                last_saved = "Last saved: Unknown"
+            self._last_saved_text = (updated_at, last_saved)
+        self.last_saved_label.setText(self._last_saved_text[1])
         
         # Update item count and weight in status bar
-        total_items = sum(item.quantity for item in self.current_character.inventory)
+        total_items = self.current_character.total_quantity()
         self.item_count_label.setText(f"Items: {total_items}")
         
         total_weight = self.current_character.total_weight()
@@ -1623,6 +2322,7 @@ class MainWindow(QMainWindow):
         self.item_rarity_combo.setCurrentIndex(0)  # Common
         self.item_equipped_check.setCurrentIndex(0)  # Not equipped
         self.item_tags_edit.clear()
+    
     def filter_inventory(self):
         """Filter inventory table based on search text and rarity filter"""
         if not self.current_character:
@@ -1632,101 +2332,61 @@ class MainWindow(QMainWindow):
         rarity_filter = self.filter_rarity_combo.currentText()
         sort_by = self.sort_by_combo.currentText()
         
-        # Sort the inventory first
-        sorted_inventory = list(self.current_character.inventory)
-        if sort_by == "Name":
-            sorted_inventory.sort(key=lambda x: x.name)
-        elif sort_by == "Quantity":
-            sorted_inventory.sort(key=lambda x: x.quantity, reverse=True)
-        elif sort_by == "Weight":
-            sorted_inventory.sort(key=lambda x: x.weight, reverse=True)
-        elif sort_by == "Value":
-            sorted_inventory.sort(key=lambda x: x.value, reverse=True)
-        elif sort_by == "Rarity":
-            sorted_inventory.sort(key=lambda x: x.rarity.value, reverse=True)
-        
-        # Now filter and display
-        self.inventory_table.setRowCount(0)
-        row = 0
-        
-        for item in sorted_inventory:
-            # Filter by search text
-            if search_text and search_text not in item.name.lower() and search_text not in item.description.lower():
-                continue
-                
-            # Filter by rarity
-            if rarity_filter != "All Rarities" and item.rarity.name.capitalize() != rarity_filter:
-                continue
-                
-            # Add item to table
-            self.inventory_table.insertRow(row)
-            
-            # Fill in row data (reusing code from update_inventory_table)
-            # ... (this would be the same code as in update_inventory_table for a single row)
-            
-            row += 1
+        key = (search_text, rarity_filter, sort_by)
+        filtered = self._filter_cache.get(key)
+        if filtered is None:
+            filtered = self._filter_items(search_text, rarity_filter, sort_by)
+            self._filter_cache[key] = filtered
+            if len(self._filter_cache) > self.FILTER_CACHE_SIZE:
+                self._filter_cache.popitem(last=False)
+        else:
+            self._filter_cache.move_to_end(key)
+        self._last_filter_key = key
+        
+        self.inventory_model.set_items(filtered)
             
         # Update counters
-        self.total_items_label.setText(f"Showing {row} of {len(self.current_character.inventory)} items")
+        self.total_items_label.setText(f"Showing {len(filtered)} of {len(self.current_character.inventory)} items")
+    
+    def _filter_items(self, search_text, rarity_filter, sort_by):
+        """Sorted list of the current character's items matching a filter"""
+        # Typing more of the previous query can only narrow its matches, so
+        # search within those (already sorted and rarity filtered) instead
+        last_key = self._last_filter_key
+        if (last_key is not None and last_key[1:] == (rarity_filter, sort_by)
+                and search_text.startswith(last_key[0]) and last_key in self._filter_cache):
+            return [item for item in self._filter_cache[last_key] if search_text in item.search_text()]
+        
+        # Sort the inventory first, once per sort order
+        sorted_inventory = self._sorted_inventory.get(sort_by)
+        if sorted_inventory is None:
+            sorted_inventory = list(self.current_character.inventory)
+            sort_key = self.SORT_KEYS.get(sort_by)
+            if sort_key is not None:
+                key, descending = sort_key
+                sorted_inventory.sort(key=key, reverse=descending)
+            self._sorted_inventory[sort_by] = sorted_inventory
+        
+        # Now filter, skipping any filter that is not in use; with neither,
+        # the sorted inventory is the result as is
+        filtered = sorted_inventory
+        if rarity_filter != "All Rarities":
+            rarity = _RARITY_FROM_DISPLAY[rarity_filter]
+            filtered = [item for item in filtered if item.rarity is rarity]
+        if search_text:
+            filtered = [item for item in filtered if search_text in item.search_text()]
+        
+        return filtered
         
     def update_notes_preview(self):
         """Update the notes preview with basic markdown rendering"""
-        # In a full implementation, this would use a proper markdown renderer
-        # For now, we'll do some simple replacements to simulate markdown
         text = self.notes_edit.toPlainText()
-        
-        # Handle headings
-        text = text.replace("# ", "<h1>").replace(" #", "</h1>")
-        text = text.replace("## ", "<h2>").replace(" ##", "</h2>")
-        text = text.replace("### ", "<h3>").replace(" ###", "</h3>")
-        
-        # Handle formatting
-        text = text.replace("**", "<b>", 1)
-        while "**" in text:
-            text = text.replace("**", "</b>", 1)
-            if "**" in text:
-                text = text.replace("**", "<b>", 1)
-        
-        text = text.replace("*", "<i>", 1)
-        while "*" in text:
-            text = text.replace("*", "</i>", 1)
-            if "*" in text:
-                text = text.replace("*", "<i>", 1)
-        
-        text = text.replace("__", "<u>", 1)
-        while "__" in text:
-            text = text.replace("__", "</u>", 1)
-            if "__" in text:
-                text = text.replace("__", "<u>", 1)
-        
-        text = text.replace("~~", "<s>", 1)
-        while "~~" in text:
-            text = text.replace("~~", "</s>", 1)
-            if "~~" in text:
-                text = text.replace("~~", "<s>", 1)
-        
-        # Handle code
-        text = text.replace("`", "<code>", 1)
-        while "`" in text:
-            text = text.replace("`", "</code>", 1)
-            if "`" in text:
-                text = text.replace("`", "<code>", 1)
-        
-        # Handle lists (simple)
-        text = text.replace("\n- ", "\n• ")
-        
-        # Handle horizontal rules
-        text = text.replace("\n---\n", "\n<hr>\n")
-        
-        # Handle blockquotes
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if line.startswith("> "):
-                lines[i] = f"<blockquote>{line[2:]}</blockquote>"
-        text = "\n".join(lines)
-        
-        # Set the HTML
-        self.notes_preview.setHtml(f"<div style='color: #e0e0e0; font-family: Segoe UI, Arial; font-size: 10pt;'>{text}</div>")
+        # Nothing to do if the text is back where it was at the last render,
+        # e.g. after an edit was undone or another character has the same notes
+        if text == self._notes_preview_text:
+            return
+        self._notes_preview_text = text
+        self.notes_preview.setHtml(render_notes_html(text))
     
     def insert_character_template(self):
         """Insert a character bio template into the notes editor"""
@@ -1927,14 +2587,26 @@ class MainWindow(QMainWindow):
             portrait_path = self.current_character.portrait
             if not os.path.isabs(portrait_path):
                 # If relative, try to find it relative to the application path
-                portrait_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), portrait_path)
+                portrait_path = os.path.join(APP_DIR, portrait_path)
                 
-            if os.path.exists(portrait_path):
+            # Reuse the decoded portrait if this file has been shown before
+            # A missing file just gives a null pixmap, so no existence check
+            pixmap = QPixmapCache.find(portrait_path)
+            if pixmap is None:
                 pixmap = QPixmap(portrait_path)
                 if not pixmap.isNull():
-                    # Set the portrait image
-                    self.portrait_label.setPixmap(pixmap)
-                    return
+                    # Scale once to the fixed label size instead of letting the
+                    # label rescale the full-size image on every repaint
+                    pixmap = pixmap.scaled(
+                        self.portrait_label.maximumSize(),
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+                    QPixmapCache.insert(portrait_path, pixmap)
+                    
+            if pixmap is not None and not pixmap.isNull():
+                self.portrait_label.setPixmap(pixmap)
+                return
                     
             # If we got here, loading failed
             self.portrait_label.clear()
@@ -1958,15 +2630,16 @@ class MainWindow(QMainWindow):
         
         if file_path:
             # Try to make the path relative to the application
-            app_dir = os.path.dirname(os.path.abspath(__file__))
             try:
                 # Try to convert to a relative path if the file is within the app directory
-                if file_path.startswith(app_dir):
-                    relative_path = os.path.relpath(file_path, app_dir)
+                if file_path.startswith(APP_DIR):
+                    relative_path = os.path.relpath(file_path, APP_DIR)
                     self.current_character.portrait = relative_path
                 else:
                     # Otherwise use absolute path
                     self.current_character.portrait = file_path
+                
+                self.current_character.mark_dirty()
                     
                 # Update the portrait display
                 self.update_character_portrait()
@@ -1975,69 +2648,64 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, "Portrait Error", f"Error setting portrait: {str(e)}")
 
 
+# Splash screen colors; its font needs a QApplication, so main() creates it
+SPLASH_BG_COLOR = QColor(40, 40, 40)
+SPLASH_TEXT_COLOR = QColor(200, 200, 200)
+
+
 def main():
     """Application entry point"""
-    log_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tabletop_log.txt")
-    with open(log_path, "w") as log:
-        log.write("Starting TabletopInventory application...\n")
-        try:
-            app = QApplication(sys.argv)
-            log.write("QApplication created\n")
-            
-            # Apply global stylesheet
-            app.setStyleSheet(GLOBAL_STYLESHEET)
-            
-            # Create and show splash screen
-            splash_pixmap = QPixmap(400, 300)
-            splash_pixmap.fill(QColor(40, 40, 40))
-            
-            # In a real app, you would use an actual image file like this:
-            # splash_pixmap = QPixmap("path/to/splash_image.png")
-            
-            splash = QSplashScreen(splash_pixmap)
-            
-            # Add text to splash screen
-            splash_font = QFont("Segoe UI", 14)
-            splash_font.setBold(True)
-            splash.setFont(splash_font)
-            
-            # Show the splash screen
-            splash.show()
-            splash.showMessage(
-                "TabletopInventory\nLoading...", 
-                Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
-                QColor(200, 200, 200)
-            )
-            
-            app.processEvents()
-            
-            # Give the splash screen time to display and simulate loading
-            for i in range(1, 5):
-                splash.showMessage(
-                    f"TabletopInventory\nLoading modules... {i*25}%", 
-                    Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
-                    QColor(200, 200, 200)
-                )
-                app.processEvents()
-                QTimer.singleShot(300, lambda: None)
-                app.processEvents()
-            
-            log.write("MainWindow creating...\n")
-            window = MainWindow()
-            log.write("MainWindow created\n")
-            
-            # Finish splash and show main window
-            splash.finish(window)
-            window.show()
-            
-            log.write("Window shown - if you don't see it, check your display settings\n")
-            log.flush()
-            return app.exec()
-        except Exception as e:
-            log.write(f"Error: {str(e)}\n")
-            import traceback
-            log.write(traceback.format_exc())
-            return 1
+    log_handler = logging.FileHandler(os.path.join(APP_DIR, "tabletop_log.txt"), mode="w")
+    logging.basicConfig(level=logging.INFO, handlers=[log_handler], format="%(asctime)s %(message)s")
+    logging.info("Starting TabletopInventory application...")
+    try:
+        app = QApplication.instance() or QApplication(sys.argv)
+        logging.info("QApplication created")
+        
+        # Set application style for a more professional look, then apply
+        # the global stylesheet once for every window
+        app.setStyle(QStyleFactory.create("Fusion"))
+        app.setStyleSheet(_GLOBAL_QSS)
+        
+        # Create and show splash screen
+        splash_pixmap = QPixmap(400, 300)
+        splash_pixmap.fill(SPLASH_BG_COLOR)
+        
+        # In a real app, you would use an actual image file like this:
+        # splash_pixmap = QPixmap("path/to/splash_image.png")
+        
+        splash = QSplashScreen(splash_pixmap)
+        
+        # Add text to splash screen
+        splash_font = QFont("Segoe UI", 14)
+        splash_font.setBold(True)
+        splash.setFont(splash_font)
+        
+        # Show the splash screen
+        splash.show()
+        splash.showMessage(
+            "TabletopInventory\nLoading...", 
+            Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignBottom,
+            SPLASH_TEXT_COLOR
+        )
+        
+        # Paint the splash once; it stays up while the window is built
+        app.processEvents()
+        
+        logging.info("MainWindow creating...")
+        window = MainWindow()
+        logging.info("MainWindow created")
+        
+        # Finish splash and show main window
+        splash.finish(window)
+        window.show()
+        
+        logging.info("Window shown - if you don't see it, check your display settings")
+        return app.exec()
+    except Exception as e:
+        # Records the message and the traceback
+        logging.exception(f"Error: {e}")
+        return 1
 
 
 if __name__ == "__main__":
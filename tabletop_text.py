@@ -10,14 +10,49 @@ Author: StrayDog Syndications LLC
 Version: 1.0.0
 """
 
-import json
+import argparse
 import os
 import sys
-import uuid
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional
 from enum import Enum, auto
+from math import fsum
+from operator import attrgetter, mul
+
+# Use orjson for character files when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(data, pretty: bool = False) -> bytes:
+    """Serialize data to compact (or indented) UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    import json  # Only needed without orjson
+    if pretty:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json  # Only needed without orjson
+    return json.loads(data)
+
+
+def _new_id() -> str:
+    """A fresh UUID string for a new character or item"""
+    import uuid  # Only needed once something is created
+    return str(uuid.uuid4())
+
+
+# slots=True needs Python 3.10+; older interpreters get plain dataclasses
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ItemRarity(Enum):
@@ -30,7 +65,16 @@ class ItemRarity(Enum):
     ARTIFACT = auto()
 
 
-@dataclass
+# Name shown for each rarity in item listings and the rarity menu
+for _rarity in ItemRarity:
+    _rarity.display = _rarity.name.capitalize()
+del _rarity
+
+# Rarities in menu order, for picking one by number
+_RARITIES = tuple(ItemRarity)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Item:
     """Represents an inventory item"""
     id: str  # UUID for the item
@@ -46,15 +90,29 @@ class Item:
     def __post_init__(self):
         """Ensure id is a string UUID"""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = _new_id()
             
     def display(self) -> str:
         """Return a string representation of the item"""
         equipped_str = "[E]" if self.equipped else ""
-        return f"{self.name} {equipped_str} - Qty: {self.quantity}, Value: {self.value}, Weight: {self.weight}, Rarity: {self.rarity.name.capitalize()}"
+        return f"{self.name} {equipped_str} - Qty: {self.quantity}, Value: {self.value}, Weight: {self.weight}, Rarity: {self.rarity.display}"
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the item"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "quantity": self.quantity,
+            "weight": self.weight,
+            "value": self.value,
+            "rarity": self.rarity.name,
+            "equipped": self.equipped,
+            "tags": self.tags,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Currency:
     """Represents character currency with multiple denominations"""
     platinum: int = 0
@@ -69,9 +127,53 @@ class Currency:
     def display(self) -> str:
         """Return a string representation of the currency"""
         return f"PP: {self.platinum}, GP: {self.gold}, SP: {self.silver}, CP: {self.copper}"
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the currency"""
+        return {
+            "platinum": self.platinum,
+            "gold": self.gold,
+            "silver": self.silver,
+            "copper": self.copper,
+        }
+
+
+# Item field getters for the weight and value totals
+_QUANTITY = attrgetter("quantity")
+_WEIGHT = attrgetter("weight")
+_VALUE = attrgetter("value")
+
+# Fields copied as-is from a save file; any other keys in it are ignored
+_CHARACTER_FIELDS = ("id", "name", "game_system", "level", "notes", "created_at", "updated_at")
+_ITEM_FIELDS = ("id", "name", "description", "quantity", "weight", "value", "rarity", "equipped", "tags")
+_CURRENCY_FIELDS = ("platinum", "gold", "silver", "copper")
+
+# Rules framing the text screens
+_RULE = "=" * 50
+_DIVIDER = "-" * 50
+
+
+def _header(title: str) -> str:
+    """A screen title framed by rules, after a blank line"""
+    return f"\n{_RULE}\n{title.center(50)}\n{_RULE}"
+
+
+def _prompt_int(prompt: str, default: Optional[int] = None) -> Optional[int]:
+    """Ask for a whole number; blank or non-numeric input gives the default"""
+    text = input(prompt).strip()
+    # Checking the digits up front avoids raising and catching ValueError
+    # for every bad entry
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if digits.isdecimal() else default
 
 
-@dataclass
+def _menu(*options: str) -> str:
+    """Numbered menu options between dividers, ready to print at once"""
+    lines = [f"{i}. {option}" for i, option in enumerate(options, 1)]
+    return "\n".join([_DIVIDER, *lines, _DIVIDER])
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class Character:
     """Represents a character and their inventory"""
     id: str  # UUID for the character
@@ -83,48 +185,89 @@ class Character:
     notes: str = ""
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    # Inventory items by id, for get_item and remove_item; not saved
+    _by_id: Dict[str, Item] = field(default_factory=dict, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Ensure id is a string UUID"""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = _new_id()
+        # Saves can repeat an id; like a scan, the index keeps the first such item
+        for item in self.inventory:
+            self._by_id.setdefault(item.id, item)
+    
+    def get_item(self, item_id: str) -> Optional[Item]:
+        """Look up an inventory item by ID"""
+        return self._by_id.get(item_id)
+    
+    # updated_at is stamped once per save by TextInterface.save_character,
+    # not on every inventory change
     
     def add_item(self, item: Item) -> None:
         """Add an item to the inventory"""
         self.inventory.append(item)
-        self.updated_at = datetime.now().isoformat()
+        self._by_id.setdefault(item.id, item)
     
     def remove_item(self, item_id: str) -> Optional[Item]:
         """Remove an item from inventory by ID"""
-        for i, item in enumerate(self.inventory):
-            if item.id == item_id:
-                self.updated_at = datetime.now().isoformat()
-                return self.inventory.pop(i)
-        return None
+        item = self._by_id.pop(item_id, None)
+        if item is None:
+            return None
+        # Find the entry itself, not just one that compares equal
+        for index, candidate in enumerate(self.inventory):
+            if candidate is item:
+                del self.inventory[index]
+                break
+        # Any later copy of the id is now the first one
+        for candidate in self.inventory[index:]:
+            if candidate.id == item_id:
+                self._by_id[item_id] = candidate
+                break
+        return item
     
     def total_weight(self) -> float:
         """Calculate total weight of all inventory items"""
-        return sum(item.quantity * item.weight for item in self.inventory)
+        inventory = self.inventory
+        # fsum keeps fractional weights from piling up rounding error
+        return fsum(map(mul, map(_QUANTITY, inventory), map(_WEIGHT, inventory)))
     
     def total_value(self) -> float:
         """Calculate total value of all inventory items"""
-        return sum(item.quantity * item.value for item in self.inventory)
+        inventory = self.inventory
+        return fsum(map(mul, map(_QUANTITY, inventory), map(_VALUE, inventory)))
+    
+    def to_dict(self) -> dict:
+        """Build the JSON-ready representation of the character"""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "game_system": self.game_system,
+            "level": self.level,
+            "inventory": [item.to_dict() for item in self.inventory],
+            "currency": self.currency.to_dict(),
+            "notes": self.notes,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
 
 
 class CharacterManager:
     """Manages character data and persistence"""
     
-    def __init__(self, save_dir: str = None):
+    def __init__(self, save_dir: str = None, pretty: bool = False):
         """Initialize the character manager"""
         self.characters: Dict[str, Character] = {}
         self.save_dir = save_dir or os.path.join(os.path.expanduser("~"), "tabletop_inventory")
+        # Indent saved JSON for reading by hand; compact files are smaller
+        # and faster to write and load
+        self.pretty = pretty
         
         # Create save directory if it doesn't exist
         os.makedirs(self.save_dir, exist_ok=True)
     
     def create_character(self, name: str, game_system: str = "Generic") -> Character:
         """Create a new character"""
-        character = Character(id=str(uuid.uuid4()), name=name, game_system=game_system)
+        character = Character(id=_new_id(), name=name, game_system=game_system)
         self.characters[character.id] = character
         return character
     
@@ -133,10 +276,12 @@ class CharacterManager:
         if character_id in self.characters:
             del self.characters[character_id]
             
-            # Remove saved file if it exists
+            # Remove saved file; there is none if it was never saved
             save_path = os.path.join(self.save_dir, f"{character_id}.json")
-            if os.path.exists(save_path):
+            try:
                 os.remove(save_path)
+            except FileNotFoundError:
+                pass
             
             return True
         return False
@@ -150,16 +295,11 @@ class CharacterManager:
         save_path = os.path.join(self.save_dir, f"{character_id}.json")
         
         try:
-            # Convert character to dictionary
-            character_dict = asdict(character)
+            # Convert character to dictionary, with rarities as enum names
+            character_dict = character.to_dict()
             
-            # Convert enum values to strings
-            for item in character_dict["inventory"]:
-                if isinstance(item["rarity"], ItemRarity):
-                    item["rarity"] = item["rarity"].name
-            
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(character_dict, f, indent=2)
+            with open(save_path, 'wb') as f:
+                f.write(dump_json(character_dict, self.pretty))
             return True
         
         except Exception as e:
@@ -168,52 +308,33 @@ class CharacterManager:
     
     def load_character(self, file_path: str) -> Optional[Character]:
         """Load a character from file"""
+        character = self._read_character(file_path)
+        if character:
+            self.characters[character.id] = character
+        return character
+    
+    def _read_character(self, file_path: str) -> Optional[Character]:
+        """Read and parse a character file without registering it"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                character_dict = json.load(f)
-            
-            # Convert string rarity back to enum
-            for item in character_dict["inventory"]:
-                if isinstance(item["rarity"], str):
-                    item["rarity"] = ItemRarity[item["rarity"]]
-            
-            # Create character object
-            character = Character(
-                id=character_dict["id"],
-                name=character_dict["name"],
-                game_system=character_dict["game_system"],
-                level=character_dict["level"],
-                notes=character_dict["notes"],
-                created_at=character_dict["created_at"],
-                updated_at=character_dict["updated_at"]
-            )
+            with open(file_path, 'rb') as f:
+                character_dict = load_json(f.read())
             
-            # Add inventory items
+            # Build items from their known keys once rarity is an enum again;
+            # keys this edition doesn't use, such as the GUI's, are skipped
+            inventory = []
             for item_dict in character_dict["inventory"]:
-                item = Item(
-                    id=item_dict["id"],
-                    name=item_dict["name"],
-                    description=item_dict["description"],
-                    quantity=item_dict["quantity"],
-                    weight=item_dict["weight"],
-                    value=item_dict["value"],
-                    rarity=item_dict["rarity"],
-                    equipped=item_dict["equipped"],
-                    tags=item_dict["tags"]
-                )
-                character.inventory.append(item)
+                if isinstance(item_dict["rarity"], str):
+                    item_dict["rarity"] = ItemRarity[item_dict["rarity"]]
+                inventory.append(Item(**{name: item_dict[name] for name in _ITEM_FIELDS if name in item_dict}))
             
-            # Add currency
             currency_dict = character_dict["currency"]
-            character.currency = Currency(
-                platinum=currency_dict["platinum"],
-                gold=currency_dict["gold"],
-                silver=currency_dict["silver"],
-                copper=currency_dict["copper"]
-            )
             
-            # Add character to dictionary
-            self.characters[character.id] = character
+            # Passing the inventory in lets __post_init__ index it by id
+            character = Character(
+                **{name: character_dict[name] for name in _CHARACTER_FIELDS},
+                inventory=inventory,
+                currency=Currency(**{name: currency_dict[name] for name in _CURRENCY_FIELDS if name in currency_dict})
+            )
             
             return character
         
@@ -221,16 +342,30 @@ class CharacterManager:
             print(f"Error loading character: {e}")
             return None
     
+    def saved_character_paths(self) -> List[str]:
+        """Paths of all character save files in the save directory"""
+        with os.scandir(self.save_dir) as entries:
+            return [entry.path for entry in entries if entry.name.endswith(".json")]
+    
     def load_all_characters(self) -> List[Character]:
         """Load all characters from save directory"""
-        characters = []
+        file_paths = self.saved_character_paths()
+        
+        if not file_paths:
+            return []
         
-        for file_name in os.listdir(self.save_dir):
-            if file_name.endswith(".json"):
-                file_path = os.path.join(self.save_dir, file_name)
-                character = self.load_character(file_path)
-                if character:
-                    characters.append(character)
+        # Imported here since the menus never load every character at once
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Parse the files in parallel, then register them here in listing order
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths))) as executor:
+            loaded = list(executor.map(self._read_character, file_paths))
+        
+        characters = []
+        for character in loaded:
+            if character:
+                self.characters[character.id] = character
+                characters.append(character)
         
         return characters
 
@@ -238,27 +373,24 @@ class CharacterManager:
 class TextInterface:
     """Text-based user interface for TabletopInventory"""
     
-    def __init__(self):
+    # Menus are built once and printed with a single call per screen
+    MAIN_MENU = _menu("Create New Character", "Load Character", "Save Character",
+                      "Character Details", "Inventory Management", "Currency Management", "Exit")
+    DETAILS_MENU = _menu("Edit Name", "Edit Game System", "Edit Level", "Edit Notes", "Back to Main Menu")
+    INVENTORY_MENU = _menu("View Inventory", "Add Item", "Remove Item", "Back to Main Menu")
+    CURRENCY_MENU = _menu("Edit Platinum", "Edit Gold", "Edit Silver", "Edit Copper", "Back to Main Menu")
+    
+    def __init__(self, pretty: bool = False):
         """Initialize the text interface"""
-        self.character_manager = CharacterManager()
+        self.character_manager = CharacterManager(pretty=pretty)
         self.current_character = None
         self.running = True
         
     def main_menu(self):
         """Display the main menu"""
-        print("\n" + "=" * 50)
-        print("TABLETOP INVENTORY MANAGER".center(50))
-        print("=" * 50)
-        print(f"Current Character: {self.current_character.name if self.current_character else 'None'}")
-        print("-" * 50)
-        print("1. Create New Character")
-        print("2. Load Character")
-        print("3. Save Character")
-        print("4. Character Details")
-        print("5. Inventory Management")
-        print("6. Currency Management")
-        print("7. Exit")
-        print("-" * 50)
+        print(f"{_header('TABLETOP INVENTORY MANAGER')}\n"
+              f"Current Character: {self.current_character.name if self.current_character else 'None'}\n"
+              f"{self.MAIN_MENU}")
         
         choice = input("Enter choice (1-7): ")
         
@@ -281,9 +413,7 @@ class TextInterface:
     
     def create_character(self):
         """Create a new character"""
-        print("\n" + "=" * 50)
-        print("CREATE NEW CHARACTER".center(50))
-        print("=" * 50)
+        print(_header("CREATE NEW CHARACTER"))
         
         name = input("Enter character name: ")
         if not name:
@@ -294,11 +424,7 @@ class TextInterface:
         if not game_system:
             game_system = "Generic"
         
-        level = input("Enter character level (or leave blank for 1): ")
-        try:
-            level = int(level) if level else 1
-        except ValueError:
-            level = 1
+        level = _prompt_int("Enter character level (or leave blank for 1): ", 1)
             
         character = self.character_manager.create_character(name, game_system)
         character.level = level
@@ -308,15 +434,10 @@ class TextInterface:
     
     def load_character(self):
         """Load a character from file"""
-        print("\n" + "=" * 50)
-        print("LOAD CHARACTER".center(50))
-        print("=" * 50)
+        print(_header("LOAD CHARACTER"))
         
         # Get all character files
-        character_files = []
-        for file_name in os.listdir(self.character_manager.save_dir):
-            if file_name.endswith(".json"):
-                character_files.append(file_name)
+        character_files = self.character_manager.saved_character_paths()
         
         if not character_files:
             print("No saved characters found.")
@@ -324,27 +445,22 @@ class TextInterface:
         
         # Display character files
         print("Available characters:")
-        for i, file_name in enumerate(character_files, 1):
-            print(f"{i}. {file_name}")
+        for i, file_path in enumerate(character_files, 1):
+            print(f"{i}. {os.path.basename(file_path)}")
         
-        choice = input("Enter choice (or 0 to cancel): ")
-        try:
-            choice = int(choice)
-            if choice == 0:
-                return
-            if choice < 1 or choice > len(character_files):
-                print("Invalid choice.")
-                return
-            
-            file_path = os.path.join(self.character_manager.save_dir, character_files[choice - 1])
-            character = self.character_manager.load_character(file_path)
-            if character:
-                self.current_character = character
-                print(f"Character '{character.name}' loaded successfully!")
-            else:
-                print("Failed to load character.")
-        except ValueError:
+        choice = _prompt_int("Enter choice (or 0 to cancel): ")
+        if choice == 0:
+            return
+        if choice is None or choice < 1 or choice > len(character_files):
             print("Invalid choice.")
+            return
+        
+        character = self.character_manager.load_character(character_files[choice - 1])
+        if character:
+            self.current_character = character
+            print(f"Character '{character.name}' loaded successfully!")
+        else:
+            print("Failed to load character.")
     
     def save_character(self):
         """Save the current character to file"""
@@ -352,9 +468,7 @@ class TextInterface:
             print("No character selected.")
             return
         
-        print("\n" + "=" * 50)
-        print("SAVE CHARACTER".center(50))
-        print("=" * 50)
+        print(_header("SAVE CHARACTER"))
         
         # Update timestamp
         self.current_character.updated_at = datetime.now().isoformat()
@@ -371,23 +485,16 @@ class TextInterface:
             print("No character selected.")
             return
         
-        print("\n" + "=" * 50)
-        print("CHARACTER DETAILS".center(50))
-        print("=" * 50)
-        print(f"Name: {self.current_character.name}")
-        print(f"Game System: {self.current_character.game_system}")
-        print(f"Level: {self.current_character.level}")
-        print(f"Currency: {self.current_character.currency.display()}")
-        print(f"Created: {self.current_character.created_at}")
-        print(f"Updated: {self.current_character.updated_at}")
-        print(f"Notes: {self.current_character.notes}")
-        print("-" * 50)
-        print("1. Edit Name")
-        print("2. Edit Game System")
-        print("3. Edit Level")
-        print("4. Edit Notes")
-        print("5. Back to Main Menu")
-        print("-" * 50)
+        character = self.current_character
+        print(f"{_header('CHARACTER DETAILS')}\n"
+              f"Name: {character.name}\n"
+              f"Game System: {character.game_system}\n"
+              f"Level: {character.level}\n"
+              f"Currency: {character.currency.display()}\n"
+              f"Created: {character.created_at}\n"
+              f"Updated: {character.updated_at}\n"
+              f"Notes: {character.notes}\n"
+              f"{self.DETAILS_MENU}")
         
         choice = input("Enter choice (1-5): ")
         
@@ -402,13 +509,12 @@ class TextInterface:
                 self.current_character.game_system = game_system
                 print("Game system updated.")
         elif choice == "3":
-            level = input("Enter new level: ")
-            try:
-                level = int(level)
+            level = _prompt_int("Enter new level: ")
+            if level is None:
+                print("Invalid level.")
+            else:
                 self.current_character.level = level
                 print("Level updated.")
-            except ValueError:
-                print("Invalid level.")
         elif choice == "4":
             notes = input("Enter new notes: ")
             self.current_character.notes = notes
@@ -425,19 +531,13 @@ class TextInterface:
             return
         
         while True:
-            print("\n" + "=" * 50)
-            print("INVENTORY MANAGEMENT".center(50))
-            print("=" * 50)
-            print(f"Character: {self.current_character.name}")
-            print(f"Total Items: {sum(item.quantity for item in self.current_character.inventory)}")
-            print(f"Total Weight: {self.current_character.total_weight():.1f}")
-            print(f"Total Value: {self.current_character.total_value():.1f}")
-            print("-" * 50)
-            print("1. View Inventory")
-            print("2. Add Item")
-            print("3. Remove Item")
-            print("4. Back to Main Menu")
-            print("-" * 50)
+            character = self.current_character
+            print(f"{_header('INVENTORY MANAGEMENT')}\n"
+                  f"Character: {character.name}\n"
+                  f"Total Items: {sum(map(_QUANTITY, character.inventory))}\n"
+                  f"Total Weight: {character.total_weight():.1f}\n"
+                  f"Total Value: {character.total_value():.1f}\n"
+                  f"{self.INVENTORY_MENU}")
             
             choice = input("Enter choice (1-4): ")
             
@@ -458,22 +558,21 @@ class TextInterface:
             print("Inventory is empty.")
             return
         
-        print("\n" + "=" * 50)
-        print("INVENTORY".center(50))
-        print("=" * 50)
+        print(_header("INVENTORY"))
         
+        # Build the listing first and print it in one call
+        lines = []
         for i, item in enumerate(self.current_character.inventory, 1):
-            print(f"{i}. {item.display()}")
+            lines.append(f"{i}. {item.display()}")
             if item.description:
-                print(f"   Description: {item.description}")
+                lines.append(f"   Description: {item.description}")
+        print("\n".join(lines))
         
         input("\nPress Enter to continue...")
     
     def add_item(self):
         """Add an item to inventory"""
-        print("\n" + "=" * 50)
-        print("ADD ITEM".center(50))
-        print("=" * 50)
+        print(_header("ADD ITEM"))
         
         name = input("Enter item name: ")
         if not name:
@@ -482,13 +581,7 @@ class TextInterface:
         
         description = input("Enter item description (optional): ")
         
-        quantity = input("Enter quantity (default 1): ")
-        try:
-            quantity = int(quantity) if quantity else 1
-            if quantity < 1:
-                quantity = 1
-        except ValueError:
-            quantity = 1
+        quantity = max(_prompt_int("Enter quantity (default 1): ", 1), 1)
         
         weight = input("Enter weight (default 0): ")
         try:
@@ -507,22 +600,17 @@ class TextInterface:
             value = 0.0
         
         print("Rarity options:")
-        for i, rarity in enumerate(ItemRarity, 1):
-            print(f"{i}. {rarity.name.capitalize()}")
+        print("\n".join(f"{i}. {rarity.display}" for i, rarity in enumerate(_RARITIES, 1)))
         
-        rarity_choice = input("Enter rarity (1-6, default 1): ")
-        try:
-            rarity_index = int(rarity_choice) - 1 if rarity_choice else 0
-            if rarity_index < 0 or rarity_index >= len(ItemRarity):
-                rarity_index = 0
-            rarity = list(ItemRarity)[rarity_index]
-        except ValueError:
-            rarity = ItemRarity.COMMON
+        rarity_index = _prompt_int("Enter rarity (1-6, default 1): ", 1) - 1
+        if rarity_index < 0 or rarity_index >= len(_RARITIES):
+            rarity_index = 0
+        rarity = _RARITIES[rarity_index]
         
         equipped = input("Is this item equipped? (y/n, default n): ").lower() == 'y'
         
         item = Item(
-            id=str(uuid.uuid4()),
+            id=_new_id(),
             name=name,
             description=description,
             quantity=quantity,
@@ -541,27 +629,21 @@ class TextInterface:
             print("Inventory is empty.")
             return
         
-        print("\n" + "=" * 50)
-        print("REMOVE ITEM".center(50))
-        print("=" * 50)
+        print(_header("REMOVE ITEM"))
         
-        for i, item in enumerate(self.current_character.inventory, 1):
-            print(f"{i}. {item.name} (Qty: {item.quantity})")
+        print("\n".join(f"{i}. {item.name} (Qty: {item.quantity})"
+                        for i, item in enumerate(self.current_character.inventory, 1)))
         
-        choice = input("Enter item number to remove (or 0 to cancel): ")
-        try:
-            choice = int(choice)
-            if choice == 0:
-                return
-            if choice < 1 or choice > len(self.current_character.inventory):
-                print("Invalid choice.")
-                return
-            
-            item = self.current_character.inventory[choice - 1]
-            self.current_character.remove_item(item.id)
-            print(f"Item '{item.name}' removed from inventory.")
-        except ValueError:
+        choice = _prompt_int("Enter item number to remove (or 0 to cancel): ")
+        if choice == 0:
+            return
+        if choice is None or choice < 1 or choice > len(self.current_character.inventory):
             print("Invalid choice.")
+            return
+        
+        item = self.current_character.inventory[choice - 1]
+        self.current_character.remove_item(item.id)
+        print(f"Item '{item.name}' removed from inventory.")
     
     def currency_management(self):
         """Manage character currency"""
@@ -570,19 +652,12 @@ class TextInterface:
             return
         
         while True:
-            print("\n" + "=" * 50)
-            print("CURRENCY MANAGEMENT".center(50))
-            print("=" * 50)
-            print(f"Character: {self.current_character.name}")
-            print(f"Currency: {self.current_character.currency.display()}")
-            print(f"Total in Copper: {self.current_character.currency.total_in_copper()}")
-            print("-" * 50)
-            print("1. Edit Platinum")
-            print("2. Edit Gold")
-            print("3. Edit Silver")
-            print("4. Edit Copper")
-            print("5. Back to Main Menu")
-            print("-" * 50)
+            character = self.current_character
+            print(f"{_header('CURRENCY MANAGEMENT')}\n"
+                  f"Character: {character.name}\n"
+                  f"Currency: {character.currency.display()}\n"
+                  f"Total in Copper: {character.currency.total_in_copper()}\n"
+                  f"{self.CURRENCY_MENU}")
             
             choice = input("Enter choice (1-5): ")
             
@@ -604,18 +679,17 @@ class TextInterface:
         current_value = getattr(self.current_character.currency, currency_type)
         
         print(f"Current {currency_type.capitalize()}: {current_value}")
-        new_value = input(f"Enter new {currency_type} amount: ")
+        new_value = _prompt_int(f"Enter new {currency_type} amount: ")
         
-        try:
-            new_value = int(new_value)
-            if new_value < 0:
-                print("Currency cannot be negative.")
-                return
-            
-            setattr(self.current_character.currency, currency_type, new_value)
-            print(f"{currency_type.capitalize()} updated to {new_value}.")
-        except ValueError:
+        if new_value is None:
             print("Invalid value.")
+            return
+        if new_value < 0:
+            print("Currency cannot be negative.")
+            return
+        
+        setattr(self.current_character.currency, currency_type, new_value)
+        print(f"{currency_type.capitalize()} updated to {new_value}.")
     
     def run(self):
         """Run the text interface"""
@@ -629,7 +703,12 @@ class TextInterface:
 
 def main():
     """Application entry point"""
-    interface = TextInterface()
+    parser = argparse.ArgumentParser(description="TabletopInventory (Text Edition)")
+    parser.add_argument("--pretty", action="store_true",
+                        help="save character files as indented, human-readable JSON")
+    args = parser.parse_args()
+    
+    interface = TextInterface(pretty=args.pretty)
     interface.run()
 
 